@@ -0,0 +1,10 @@
+"""
+pytest configuration shared by the test_*.py scripts in the repository root.
+Puts the repository root on sys.path once per session so ``from src.nodes import ...`` resolves.
+"""
+import sys
+from pathlib import Path
+
+_ROOT = str(Path(__file__).resolve().parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -3,6 +3,7 @@ Core data structures for the node graph system
 """
 from abc import ABC, abstractmethod, ABCMeta
 from typing import Any, Dict, List, Optional, Callable
+from collections import deque
 import uuid
 from PySide6.QtCore import QObject, Signal
 import json
@@ -21,6 +22,7 @@ class NodePort:
         self.is_input = is_input
         self.value = value
         self.connected_to = connected_to
+        self.dtype = None  # Optional element-type hint ("int"/"float") for list values
     
     def connect(self, other_port: 'NodePort') -> bool:
         """Connect this port to another port"""
@@ -56,6 +58,18 @@ class ProcessNode(QObject, ABC, metaclass=MetaQObjectABC):
         self.properties: Dict[str, Any] = {}  # Ensure all nodes have a 'properties' attribute
         self.type = self.__class__.__name__.lower().replace('node', '')  # Add this line
     
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @name.setter
+    def name(self, value: str):
+        # Every rename goes through here, so cards caching the title hear about it via data_changed
+        changed = getattr(self, '_name', value) != value
+        self._name = value
+        if changed:
+            self.data_changed.emit()
+    
     def add_input_port(self, name: str, data_type: type = Any):
         """Add an input port to the node"""
         self.input_ports[name] = NodePort(name, data_type, is_input=True)
@@ -91,7 +105,10 @@ class ProcessNode(QObject, ABC, metaclass=MetaQObjectABC):
         return port_value
     
     def set_input_value(self, port_name: str, value: Any):
-        """Set the value of an input port"""
+        """
+        Set the value of an input port. The value is stored by reference, never copied:
+        nodes must treat their inputs as read-only and build new lists/arrays for outputs.
+        """
         port = self.input_ports.get(port_name)
         if port:
             port.value = value
@@ -109,11 +126,19 @@ class ProcessNode(QObject, ABC, metaclass=MetaQObjectABC):
         port = self.output_ports.get(port_name)
         return port.value if port else None
     
-    def set_output_value(self, port_name: str, value: Any):
-        """Set the value of an output port"""
+    def set_output_value(self, port_name: str, value: Any, dtype: Optional[str] = None):
+        """Set the value of an output port, optionally tagging its element type"""
         port = self.output_ports.get(port_name)
         if port:
             port.value = value
+            port.dtype = dtype
+    
+    def get_input_dtype(self, port_name: str) -> Optional[str]:
+        """Get the element-type hint of the output feeding an input port, if any"""
+        port = self.input_ports.get(port_name)
+        if port and port.connected_to:
+            return port.connected_to.dtype
+        return None
     
     @abstractmethod
     def process(self) -> bool:
@@ -236,10 +261,48 @@ class Pipeline:
         self.name = name
         self.nodes: Dict[str, ProcessNode] = {}
         self.connections: Dict[str, Connection] = {}
+        self._plan = None  # cached (downstream index, topological order, inbound index), see _execution_plan
+    
+    def _execution_plan(self):
+        """
+        Return ``(downstream, order)``: (node_id, output_port) -> [(target_node_id, target_port)]
+        and the topological node order. Rebuilt only after the graph changed: every mutator
+        (add_node/remove_node/connect_nodes/remove_connection) resets the cache.
+        """
+        return self._build_plan()[:2]
+    
+    def _build_plan(self):
+        """Return the cached plan tuple, rebuilding it after the graph changed"""
+        if self._plan is None:
+            downstream: Dict[tuple, List[tuple]] = {}
+            inbound: Dict[str, List[Connection]] = {}
+            successors: Dict[str, List[str]] = {node_id: [] for node_id in self.nodes}
+            in_degree = {node_id: 0 for node_id in self.nodes}
+            for conn in self.connections.values():
+                downstream.setdefault((conn.source_node_id, conn.source_port), []).append(
+                    (conn.target_node_id, conn.target_port))
+                inbound.setdefault(conn.target_node_id, []).append(conn)
+                if conn.source_node_id in successors and conn.target_node_id in in_degree:
+                    successors[conn.source_node_id].append(conn.target_node_id)
+                    in_degree[conn.target_node_id] += 1
+            
+            # Kahn's algorithm over the adjacency lists instead of rescanning every connection per node
+            queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+            order = []
+            while queue:
+                current = queue.popleft()
+                order.append(current)
+                for target_id in successors[current]:
+                    in_degree[target_id] -= 1
+                    if in_degree[target_id] == 0:
+                        queue.append(target_id)
+            self._plan = (downstream, order, inbound)
+        return self._plan
     
     def add_node(self, node: ProcessNode) -> str:
         """Add a node to the pipeline"""
         self.nodes[node.id] = node
+        self._plan = None
         return node.id
     
     def remove_node(self, node_id: str) -> bool:
@@ -255,6 +318,7 @@ class Pipeline:
                 self.remove_connection(conn_id)
             
             del self.nodes[node_id]
+            self._plan = None
             return True
         return False
     
@@ -281,6 +345,7 @@ class Pipeline:
                 target_port=target_port
             )
             self.connections[connection.id] = connection
+            self._plan = None
             return connection.id
         
         return None
@@ -304,20 +369,48 @@ class Pipeline:
                 target_port.disconnect()
         
         del self.connections[connection_id]
+        self._plan = None
         return True
     
-    def execute(self) -> Dict[str, Any]:
-        """Execute the pipeline by running nodes in topological order, with special handling for forEach nodes."""
+    def execute(self, keep_all: bool = True) -> Dict[str, Any]:
+        """
+        Execute the pipeline by running nodes in topological order, with special handling for forEach nodes.
+        With ``keep_all=False`` a node's outputs are released (port values and result entry) as soon as
+        every node consuming them has run, so only the sinks' outputs stay resident.
+        """
         executed = set()
         results = {}
+        downstream_index, topo_order, inbound = self._build_plan()
+        
+        # Producer bookkeeping for keep_all=False: unfinished consumer count per producer
+        pending_consumers: Dict[str, int] = {}
+        if not keep_all:
+            for conns in inbound.values():
+                for conn in conns:
+                    pending_consumers[conn.source_node_id] = pending_consumers.get(conn.source_node_id, 0) + 1
+        
+        def release_inputs(node_id):
+            """Drop the outputs of producers whose last consumer was ``node_id``"""
+            if keep_all:
+                return
+            for conn in inbound.get(node_id, ()):
+                source_id = conn.source_node_id
+                pending_consumers[source_id] -= 1
+                if pending_consumers[source_id] == 0:
+                    source = self.nodes.get(source_id)
+                    if source is not None:
+                        for port in source.output_ports.values():
+                            port.value = None
+                    if source_id in results:
+                        results[source_id]['outputs'] = {}
+        # Upstream nodes first; anything left out of the topological order (cycles) after it
+        in_order = set(topo_order)
+        run_order = topo_order + [node_id for node_id in self.nodes if node_id not in in_order]
 
         # Helper to find all downstream nodes for a given node and output port
         def get_downstream_nodes(node_id, output_port):
-            downstream = []
-            for conn in self.connections.values():
-                if conn.source_node_id == node_id and conn.source_port == output_port:
-                    downstream.append((self.nodes.get(conn.target_node_id), conn.target_port))
-            return downstream
+            return [(self.nodes.get(target_id), target_port)
+                    for target_id, target_port in downstream_index.get((node_id, output_port), ())]
 
         def can_execute_node(node: ProcessNode) -> bool:
             return node.can_execute() and node.id not in executed
@@ -341,9 +434,10 @@ class Pipeline:
         while len(executed) < len(self.nodes):
             executed_this_round = False
 
-            for node_id, node in self.nodes.items():
+            for node_id in run_order:
                 if node_id in executed:
                     continue
+                node = self.nodes[node_id]
 
                 # Special handling for forEach node
                 if isinstance(node, ProcessNode) and getattr(node, "name", "").lower() == "foreach":
@@ -374,6 +468,7 @@ class Pipeline:
                         'success': True,
                         'outputs': {name: port.value for name, port in node.output_ports.items()}
                     }
+                    release_inputs(node_id)
                     executed_this_round = True
                     continue
 
@@ -384,6 +479,7 @@ class Pipeline:
                         'success': success,
                         'outputs': {name: port.value for name, port in node.output_ports.items()}
                     }
+                    release_inputs(node_id)
                     executed_this_round = True
 
             if not executed_this_round:
@@ -394,29 +490,7 @@ class Pipeline:
     
     def get_execution_order(self) -> List[str]:
         """Get the topological order of nodes for execution"""
-        # Simplified topological sort
-        in_degree = {node_id: 0 for node_id in self.nodes}
-        
-        # Calculate in-degrees
-        for connection in self.connections.values():
-            in_degree[connection.target_node_id] += 1
-        
-        # Start with nodes that have no dependencies
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
-        result = []
-        
-        while queue:
-            current = queue.pop(0)
-            result.append(current)
-            
-            # Update in-degrees of dependent nodes
-            for connection in self.connections.values():
-                if connection.source_node_id == current:
-                    in_degree[connection.target_node_id] -= 1
-                    if in_degree[connection.target_node_id] == 0:
-                        queue.append(connection.target_node_id)
-        
-        return result
+        return list(self._execution_plan()[1])
     
     def add_connection(self, source_port: NodePort, target_port: NodePort) -> Optional[str]:
         """Add a connection between two ports"""
@@ -453,17 +527,43 @@ class JsonDefinedNode(ProcessNode):
         "logic": "result = value * factor"
     }
     """
-    def __init__(self, definition: dict):
-        super().__init__(definition.get("name", "CustomNode"))
-        self.definition = definition
+    def __init__(self, definition: dict, template: Optional['JsonNodeTemplate'] = None):
+        template = template or JsonDefinedNode.compile(definition)
+        super().__init__(template.name)
+        self.definition = template.definition
         # Add input ports
-        for inp in definition.get("input_ports", []):
-            self.add_input_port(inp["name"], eval(inp.get("type", "Any")))
+        for name, data_type in template.input_ports:
+            self.add_input_port(name, data_type)
         # Add output ports
-        for outp in definition.get("output_ports", []):
-            self.add_output_port(outp["name"], eval(outp.get("type", "Any")))
-        self.logic = definition.get("logic", "")
-        self.properties = definition.get("properties", {})
+        for name, data_type in template.output_ports:
+            self.add_output_port(name, data_type)
+        self.logic = template.logic
+        self._code = template.code
+        self.properties = template.definition.get("properties", {})
+
+    @classmethod
+    def compile(cls, definition: dict) -> 'JsonNodeTemplate':
+        """Parse a definition once (port types, compiled logic) so instances can be stamped out cheaply"""
+        input_ports = [cls._port_spec(inp) for inp in definition.get("input_ports", [])]
+        output_ports = [cls._port_spec(outp) for outp in definition.get("output_ports", [])]
+        logic = definition.get("logic", "")
+        try:
+            code = compile(logic, f"<{definition.get('name', 'CustomNode')}>", "exec")
+        except SyntaxError:
+            code = logic  # surface the error from process(), as before
+        return JsonNodeTemplate(definition, input_ports, output_ports, logic, code)
+
+    @staticmethod
+    def _port_spec(port) -> tuple:
+        """(name, type) for a port given as {"name": ..., "type": ...} or as a plain name string"""
+        if isinstance(port, str):
+            return port, Any
+        return port["name"], eval(port.get("type", "Any"))
+
+    @classmethod
+    def from_template(cls, template: 'JsonNodeTemplate') -> 'JsonDefinedNode':
+        """Create a node from a pre-compiled template without re-parsing its definition"""
+        return cls(template.definition, template)
 
     def process(self) -> bool:
         # Prepare local variables for logic execution
@@ -472,7 +572,7 @@ class JsonDefinedNode(ProcessNode):
             local_vars[inp] = self.get_input_value(inp)
         try:
             # Evaluate logic (should assign output variables)
-            exec(self.logic, {}, local_vars)
+            exec(self._code, {}, local_vars)
             # Set outputs
             for outp in self.output_ports:
                 self.set_output_value(outp, local_vars.get(outp))
@@ -481,6 +581,18 @@ class JsonDefinedNode(ProcessNode):
             print(f"Error in JsonDefinedNode '{self.name}': {e}")
             return False
 
+
+class JsonNodeTemplate:
+    """Pre-parsed JsonDefinedNode definition, built by JsonDefinedNode.compile()"""
+
+    def __init__(self, definition: dict, input_ports: list, output_ports: list, logic: str, code: Any):
+        self.definition = definition
+        self.name = definition.get("name", "CustomNode")
+        self.input_ports = input_ports
+        self.output_ports = output_ports
+        self.logic = logic
+        self.code = code
+
 # Utility functions for loading/saving custom node definitions
 def load_custom_node_definitions(json_path: str) -> list:
     with open(json_path, "r") as f:
@@ -151,6 +151,9 @@ class CustomNode(ProcessNode):
         
         self.logic_code = new_definition.get("logic", "")
         self._compile_logic()
+        
+        # Name and ports changed: let the card redraw its title and rows
+        self.data_changed.emit()
     
     def get_input_port_names(self) -> List[str]:
         """Get list of input port names"""
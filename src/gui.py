@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (QGraphicsView, QGraphicsScene, QApplication,
                               QMenu, QToolBar, QStatusBar, QGraphicsProxyWidget,
                               QLineEdit, QLabel, QFrame, QTreeWidget, QTreeWidgetItem,
                               QMessageBox, QFileDialog, QDialog)
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QTimer, QObject, QEvent
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QTimer
 from PySide6.QtGui import QPen, QBrush, QColor, QPainter, QFont, QAction, QPainterPath
 from typing import Dict, List, Optional, Tuple
 import json
@@ -15,7 +15,7 @@ import json
 from src.core import ProcessNode, DataNode, Pipeline
 from src.nodes import NODE_TYPES, create_node, get_all_node_types
 from .ui_node_port import NodePort
-from .ui_connection_widget import ConnectionWidget
+from .ui_connection_widget import ConnectionWidget, ConnectionsLayerItem
 from .ui_node_widget import NodeWidget
 
 # Only import if the file exists, otherwise we'll create it
@@ -43,6 +43,31 @@ class NodeGraphScene(QGraphicsScene):
         
         # Scene styling
         self.setBackgroundBrush(QBrush(QColor(40, 40, 40)))
+        
+        # All connections are painted by one layer item instead of one paint() per connection
+        self.connections_layer = ConnectionsLayerItem()
+        self.addItem(self.connections_layer)
+        
+        # Cards whose node changed this event-loop pass; refreshed together by _flush_refreshes
+        self._pending_refresh = set()
+        self._refresh_scheduled = False
+    
+    def _flush_refreshes(self):
+        """Refresh every queued card exactly once"""
+        self._refresh_scheduled = False
+        pending = self._pending_refresh
+        self._pending_refresh = set()
+        for node_widget in pending:
+            if node_widget.scene() is self:
+                node_widget._do_refresh()  # already deferred; don't queue a second pass
+    
+    def clear(self):
+        """Remove all items, then restore the (deleted) connections layer"""
+        self._pending_refresh.clear()
+        self.connections_layer.detach_all()
+        super().clear()
+        self.connections_layer = ConnectionsLayerItem()
+        self.addItem(self.connections_layer)
     
     def add_node(self, node_type: str, position: Tuple[float, float] = (0, 0)) -> str:
         """Add a new node to the scene"""
@@ -168,7 +193,9 @@ class NodeGraphScene(QGraphicsScene):
             for connection in connections_to_remove:
                 self.removeItem(connection)
             
-            # Remove from scene and pipeline
+            # Remove from scene and pipeline; drop the signal hookup so the node doesn't keep the card alive
+            node_widget._connect_data_changed(False)
+            node_widget._drop_edit_pool()
             self.removeItem(node_widget)
             del self.node_widgets[node_id]
             self.pipeline.remove_node(node_id)
@@ -361,7 +388,8 @@ class NodeGraphView(QGraphicsView):
         # View settings
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setRenderHint(QPainter.Antialiasing)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Cards are pixmap-cached and their bounds cover the border pen, so only dirty regions need repainting
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
         
         # Enable wheel zoom
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -677,59 +705,3 @@ class PropertyPanel(QWidget):
         # Update the visual representation
         if hasattr(self.current_node, 'update_from_definition'):
             self.current_node.update_from_definition()
-
-
-class Pipeline:
-    # ...existing code...
-    def execute(self):
-        """Execute the pipeline and return results."""
-        results = {}
-        for node_id, node in self.nodes.items():
-            try:
-                result = node.execute()
-                results[node_id] = {
-                    "name": node.name,
-                    "result": result
-                }
-            except Exception as e:
-                results[node_id] = {
-                    "name": node.name,
-                    "error": str(e)
-                }
-        return results
-    # ...existing code...
-
-class ProcessNode:
-    # ...existing code...
-    def __init__(self):
-        self.properties = {}  # Ensure all nodes have a 'properties' attribute
-    # ...existing code...
-
-class AggregateNode(ProcessNode):
-    def __init__(self):
-        super().__init__()
-        # Initialize specific properties for AggregateNode
-        self.properties = {"operation": "sum"}
-
-class TransformNode(ProcessNode):
-    def __init__(self):
-        super().__init__()
-        # Initialize specific properties for TransformNode
-        self.properties = {"transform_type": "square"}
-
-class NodeEditEventFilter(QObject):
-    def __init__(self, finish_callback):
-        super().__init__()
-        self.finish_callback = finish_callback
-
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.KeyPress:
-            if event.key() == Qt.Key_Escape:
-                self.finish_callback()
-                return True  # Stop further processing
-        elif event.type() == QEvent.FocusOut:
-            # Only finish editing if the QLineEdit is not being destroyed
-            if obj.isVisible():
-                self.finish_callback()
-            return False  # Let the event propagate
-        return False
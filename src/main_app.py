@@ -12,10 +12,31 @@ import json
 import sys
 import os
 import traceback
+from functools import lru_cache
+from pathlib import Path
 
 from src.core import Pipeline, DataNode
 from src.gui import NodeGraphScene, NodeGraphView, NodePalette, PropertyPanel
 from src.nodes import create_node
+from src.ui_node_widget import pause_refresh, resume_refresh
+
+
+@lru_cache(maxsize=None)
+def _class_has_attr(cls: type, name: str) -> bool:
+    """Check once per node class whether ``name`` is defined anywhere on its MRO"""
+    return any(name in vars(base) for base in cls.__mro__)
+
+
+def _node_has_attr(node, name: str) -> bool:
+    """Cheap replacement for hasattr() on nodes: instance dict first, then cached class probe"""
+    return name in getattr(node, '__dict__', ()) or _class_has_attr(type(node), name)
+
+
+def _json_default(obj):
+    """Serialize numpy arrays/scalars (e.g. mock numeric output) that end up in port values"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class NodeGraphEditor(QMainWindow):
@@ -182,6 +203,23 @@ class NodeGraphEditor(QMainWindow):
         """Setup status bar"""
         self.status_bar = self.statusBar()
         self.status_bar.showMessage("Ready")
+        
+        # Coalesce bursts of status updates (e.g. bulk loads) into one repaint
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
+    
+    def show_status(self, message: str, timeout: int = 0):
+        """Queue a status bar message; only the latest one within 50ms is shown"""
+        self._pending_status = (message, timeout)
+        self._status_timer.start(50)
+    
+    def _flush_status(self):
+        """Push the most recent queued message to the status bar"""
+        if self._pending_status is not None:
+            self.status_bar.showMessage(*self._pending_status)
+            self._pending_status = None
     
     def setup_connections(self):
         """Setup signal connections"""
@@ -204,20 +242,20 @@ class NodeGraphEditor(QMainWindow):
             
             node_id = self.scene.add_node(node_type, actual_position)
             if node_id:
-                self.status_bar.showMessage(f"Added {node_type} node")
+                self.show_status(f"Added {node_type} node")
                 return node_id
         except Exception as e:
-            self.status_bar.showMessage(f"Failed to add node: {e}")
+            self.show_status(f"Failed to add node: {e}")
             return None
     
     def on_node_added(self, node_id: str):
         """Handle node added to scene"""
-        self.status_bar.showMessage(f"Node {node_id[:8]} added")
+        self.show_status(f"Node {node_id[:8]} added")
     
     def on_connection_created(self, source_node: str, source_port: str, 
                             target_node: str, target_port: str):
         """Handle connection created"""
-        self.status_bar.showMessage(f"Connected {source_port} -> {target_port}")
+        self.show_status(f"Connected {source_port} -> {target_port}")
     
     def on_selection_changed(self):
         """Handle selection changes"""
@@ -231,7 +269,7 @@ class NodeGraphEditor(QMainWindow):
             if hasattr(item, 'process_node'):
                 node_id = item.process_node.id
                 self.scene.remove_node(node_id)
-                self.status_bar.showMessage(f"Deleted node {node_id[:8]}")
+                self.show_status(f"Deleted node {node_id[:8]}")
     
     def new_pipeline(self):
         """Create a new pipeline"""
@@ -242,7 +280,7 @@ class NodeGraphEditor(QMainWindow):
             self.scene.node_widgets.clear()
             self.scene.connection_widgets.clear()
             self.current_file = None
-            self.status_bar.showMessage("New pipeline created")
+            self.show_status("New pipeline created")
     
     def open_pipeline(self):
         """Open a pipeline from file"""
@@ -257,7 +295,7 @@ class NodeGraphEditor(QMainWindow):
             try:
                 self.load_pipeline(file_path)
                 self.current_file = file_path
-                self.status_bar.showMessage(f"Opened {os.path.basename(file_path)}")
+                self.show_status(f"Opened {os.path.basename(file_path)}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
     
@@ -266,7 +304,7 @@ class NodeGraphEditor(QMainWindow):
         if self.current_file:
             try:
                 self.save_pipeline_to_file(self.current_file)
-                self.status_bar.showMessage(f"Saved {os.path.basename(self.current_file)}")
+                self.show_status(f"Saved {os.path.basename(self.current_file)}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
         else:
@@ -282,22 +320,22 @@ class NodeGraphEditor(QMainWindow):
             try:
                 self.save_pipeline_to_file(file_path)
                 self.current_file = file_path
-                self.status_bar.showMessage(f"Saved as {os.path.basename(file_path)}")
+                self.show_status(f"Saved as {os.path.basename(file_path)}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
     
     def execute_pipeline(self):
         """Execute the current pipeline and show results in right panel"""
         try:
-            self.status_bar.showMessage("Executing pipeline...")
+            self.show_status("Executing pipeline...")
             results = self.pipeline.execute()
             node_id_name_map = {nid: node.name for nid, node in self.pipeline.nodes.items()}
             formatted = self.format_execution_results(results, node_id_name_map)
             self.execution_results.setPlainText(formatted)
-            self.status_bar.showMessage("Pipeline execution completed")
+            self.show_status("Pipeline execution completed")
         except Exception as e:
             self.execution_results.setPlainText(f"Pipeline execution failed: {e}")
-            self.status_bar.showMessage("Pipeline execution failed")
+            self.show_status("Pipeline execution failed")
 
     def format_execution_results(self, results: dict, node_id_name_map: dict) -> str:
         formatted = []
@@ -317,11 +355,11 @@ class NodeGraphEditor(QMainWindow):
             
             if len(execution_order) == len(self.pipeline.nodes):
                 QMessageBox.information(self, "Validation", "Pipeline is valid!")
-                self.status_bar.showMessage("Pipeline validation passed")
+                self.show_status("Pipeline validation passed")
             else:
                 QMessageBox.warning(self, "Validation", 
                                   "Pipeline has issues (cycles or missing connections)")
-                self.status_bar.showMessage("Pipeline validation failed")
+                self.show_status("Pipeline validation failed")
         except Exception as e:
             QMessageBox.critical(self, "Validation Error", f"Validation failed: {e}")
     
@@ -333,14 +371,14 @@ class NodeGraphEditor(QMainWindow):
             self.scene.pipeline = self.pipeline
             self.scene.node_widgets.clear()
             self.scene.connection_widgets.clear()
-            self.status_bar.showMessage("Pipeline cleared")
+            self.show_status("Pipeline cleared")
     
     def auto_save(self):
         """Auto-save the current pipeline"""
         if self.current_file:
             try:
                 self.save_pipeline_to_file(self.current_file)
-                self.status_bar.showMessage("Auto-saved", 2000)
+                self.show_status("Auto-saved", 2000)
             except Exception:
                 pass  # Silent fail for auto-save
     
@@ -353,8 +391,8 @@ class NodeGraphEditor(QMainWindow):
     def load_pipeline(self, file_path: str):
         """Load pipeline from JSON file"""
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            # Read the whole file in one go rather than in small buffered chunks
+            data = json.loads(Path(file_path).read_bytes())
             
             # Clear current pipeline
             self.scene.clear()
@@ -363,6 +401,9 @@ class NodeGraphEditor(QMainWindow):
             self.scene.node_widgets.clear()
             self.scene.connection_widgets.clear()
             
+            # Redraw each card once after the whole graph is in, not per restored value
+            pause_refresh()
+            
             # Load nodes
             nodes_data = data.get('nodes', [])
             node_id_mapping = {}  # Map old IDs to new IDs
@@ -378,7 +419,7 @@ class NodeGraphEditor(QMainWindow):
                     
                     # Set node properties
                     node = self.pipeline.nodes[new_node_id]
-                    if hasattr(node, 'set_data') and 'data' in node_data:
+                    if 'data' in node_data and _class_has_attr(type(node), 'set_data'):
                         node.set_data(node_data['data'])
 
                     # Restore input port values if present
@@ -388,6 +429,8 @@ class NodeGraphEditor(QMainWindow):
                                 port_obj = node.input_ports[port]
                                 if hasattr(port_obj, 'value'):
                                     port_obj.value = value
+                        if hasattr(node, 'data_changed'):
+                            node.data_changed.emit()  # deferred until resume_refresh()
             
             # Load connections
             connections_data = data.get('connections', [])
@@ -412,23 +455,20 @@ class NodeGraphEditor(QMainWindow):
             print("Exception occurred during load_pipeline:")
             traceback.print_exc()
             QMessageBox.critical(self, "Error", f"Failed to load pipeline:\n{e}")
+        finally:
+            resume_refresh()
 
     def save_pipeline_to_file(self, file_path: str):
         """Save pipeline to JSON file"""
-        # Prepare data structure
-        data = {
-            'name': self.pipeline.name,
-            'nodes': [],
-            'connections': []
-        }
-
         # Defensive: Ensure nodes and connections exist
         if not hasattr(self.pipeline, "nodes"):
             self.pipeline.nodes = {}
         if not hasattr(self.pipeline, "connections"):
             self.pipeline.connections = {}
 
-        # Save nodes
+        # Save nodes (bind append locally; this loop scales with graph size)
+        nodes_out = []
+        append_node = nodes_out.append
         for node_id, node in self.pipeline.nodes.items():
             node_data = {
                 'id': node_id,
@@ -438,7 +478,7 @@ class NodeGraphEditor(QMainWindow):
             }
 
             # Save special properties
-            if hasattr(node, 'data'):
+            if _node_has_attr(node, 'data'):
                 node_data['data'] = node.data
 
             # Always save input port values (including defaults)
@@ -450,22 +490,31 @@ class NodeGraphEditor(QMainWindow):
                         # If no value, use default or empty
                         node_data.setdefault('input_values', {})[port_name] = port.default_value if hasattr(port, 'default_value') else None
 
-            data['nodes'].append(node_data)
+            append_node(node_data)
 
         # Save connections
-        for conn_id, conn in self.pipeline.connections.items():
-            conn_data = {
+        connections_out = [
+            {
                 'id': conn_id,
                 'source_node': conn.source_node_id,
                 'source_port': conn.source_port,
                 'target_node': conn.target_node_id,
                 'target_port': conn.target_port
             }
-            data['connections'].append(conn_data)
+            for conn_id, conn in self.pipeline.connections.items()
+        ]
+
+        # Prepare data structure
+        data = {
+            'name': self.pipeline.name,
+            'nodes': nodes_out,
+            'connections': connections_out
+        }
 
-        # Write to file
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Serialize up front and write with a large buffer so the file lands in one or two syscalls
+        payload = json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+        with open(file_path, 'wb', buffering=1 << 20) as f:
+            f.write(payload)
     
     def closeEvent(self, event):
         """Handle application close"""
@@ -475,6 +524,19 @@ class NodeGraphEditor(QMainWindow):
             event.ignore()
 
 
+def _seed_demo(window: NodeGraphEditor):
+    """Create some example nodes once the event loop is running"""
+    data_node_id = window.add_node("array", (100, 100))
+    if data_node_id:
+        # Set some example data
+        data_node = window.pipeline.nodes[data_node_id]
+        if _class_has_attr(type(data_node), 'set_data'):
+            data_node.set_data([1, 2, 3, 4, 5])
+    
+    # window.add_node("transform_square", (300, 100))
+    # window.add_node("aggregate_sum", (500, 100))
+
+
 def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
@@ -488,16 +550,9 @@ def main():
     window = NodeGraphEditor()
     window.show()
     
-    # Create some example nodes
-    data_node_id = window.add_node("array", (100, 100))
-    if data_node_id:
-        # Set some example data
-        data_node = window.pipeline.nodes[data_node_id]
-        if hasattr(data_node, 'set_data'):
-            data_node.set_data([1, 2, 3, 4, 5])
-    
-    # window.add_node("transform_square", (300, 100))
-    # window.add_node("aggregate_sum", (500, 100))
+    # Seed example nodes after the first paint; set MOCKD_DEMO_NODES=0 to skip them
+    if os.environ.get("MOCKD_DEMO_NODES", "1") != "0":
+        QTimer.singleShot(0, lambda: _seed_demo(window))
     
     # Run application
     sys.exit(app.exec())
@@ -1,13 +1,130 @@
 """
 Built-in process nodes for common data operations
 """
+import dbm
+import hashlib
+import operator
+import os
+import pickle
+import shelve
+import sys
+import threading
+import uuid
+from collections import ChainMap
+from collections.abc import Sequence
+from functools import lru_cache, partial
+from itertools import islice, repeat, starmap
 import pandas as pd
 import numpy as np
 from typing import Any, List, Dict
-from src.core import TrueNode, ProcessNode, ArrayNode, DataNode, TrueNode, FalseNode, JsonDefinedNode, load_custom_node_definitions
+from src.core import TrueNode, ProcessNode, ArrayNode, DataNode, TrueNode, FalseNode, JsonDefinedNode, load_custom_node_definitions, Pipeline, Connection
 
 from mimesis import Generic, Person, Text, Numeric, Datetime, Address, Internet, Development
 
+def _new_mimesis_providers(seed=None) -> Dict[str, Any]:
+    """Create a set of Mimesis providers; each one parses locale data when constructed"""
+    kwargs = {} if seed is None else {"seed": seed}
+    return {
+        "generic": Generic(**kwargs),
+        "person": Person(**kwargs),
+        "text": Text(**kwargs),
+        "numeric": Numeric(**kwargs),
+        "datetime": Datetime(**kwargs),
+        "address": Address(**kwargs),
+        "internet": Internet(**kwargs),
+        "dev": Development(**kwargs),
+    }
+
+
+@lru_cache(maxsize=None)
+def _mimesis_providers() -> Dict[str, Any]:
+    """The shared unseeded providers, created on first use"""
+    return _new_mimesis_providers()
+
+
+# Shared RNG for MockNode's numeric generators (drawn in bulk instead of one value per call)
+_RNG = np.random.default_rng()
+
+# Below this many items the numeric generators use the pure-Python xorshift below:
+# a NumPy Generator call has a fixed cost that a few shifts per item undercut
+_SMALL_BATCH = 8
+_MASK64 = (1 << 64) - 1
+
+
+class _XorShift64:
+    """Marsaglia xorshift64 for tiny batches; seeded runs get their own instance, see _MockSource"""
+    def __init__(self, seed=None):
+        self._lock = threading.Lock()
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.state = (int(seed) & _MASK64) or 0x9E3779B97F4A7C15  # zero is a fixed point
+
+    def draws(self, n):
+        with self._lock:
+            x = self.state
+            out = []
+            for _ in range(n):
+                x ^= (x << 13) & _MASK64
+                x ^= x >> 7
+                x ^= (x << 17) & _MASK64
+                out.append(x)
+            self.state = x
+        return out
+
+    def integers(self, low, high, n):
+        """``n`` ints in [low, high); the modulo bias is negligible for 64-bit draws"""
+        span = high - low
+        if span <= 0:
+            raise ValueError(f"low >= high ({low} >= {high})")
+        return [low + x % span for x in self.draws(n)]
+
+    def uniform(self, low, high, n):
+        scale = (high - low) / (1 << 53)
+        return [low + (x >> 11) * scale for x in self.draws(n)]
+
+
+_SMALL_RNG = _XorShift64()
+
+
+class _MockSource:
+    """The randomness a mock generator draws from; seeded runs get a private one instead of reseeding shared state"""
+    def __init__(self, rng, small_rng, providers, pooled):
+        self.rng = rng
+        self.small_rng = small_rng
+        self.providers = providers  # zero-argument callable, so Mimesis is only loaded when used
+        self.pooled = pooled  # False for seeded runs, whose values must come straight from their providers
+
+
+_SHARED_SOURCE = _MockSource(_RNG, _SMALL_RNG, _mimesis_providers, pooled=True)
+
+
+def _seeded_source(seed) -> _MockSource:
+    """A fresh source with every RNG and provider seeded from ``seed``"""
+    providers = lru_cache(maxsize=None)(partial(_new_mimesis_providers, seed))
+    return _MockSource(np.random.default_rng(seed), _XorShift64(seed), providers, pooled=False)
+
+
+def _safe_divide(x, y):
+    return x / y if y != 0 else 0
+
+
+def _safe_modulo(x, y):
+    return x % y if y != 0 else 0
+
+
+# Resolved once per MathNode instead of rebuilding a dict of lambdas on every process() call
+_MATH_OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": _safe_divide,
+    "power": operator.pow,
+    "modulo": _safe_modulo,
+}
+
 
 class MathNode(ProcessNode):
     """Performs basic mathematical operations"""
@@ -15,35 +132,25 @@ class MathNode(ProcessNode):
         super().__init__(f"Math ({operation})")
         self.operation = operation
         self.type = operation  # Explicitly set type to match factory key
+        self._op = _MATH_OPERATIONS.get(operation)
         self.add_input_port("a", (int, float))
         self.add_input_port("b", (int, float))
         self.add_output_port("result", (int, float))
     
     def process(self) -> bool:
-        try:
-            a = self.get_input_value("a")
-            b = self.get_input_value("b")
-            
-            if a is None or b is None:
-                return False
-            
-            operations = {
-                "add": lambda x, y: x + y,
-                "subtract": lambda x, y: x - y,
-                "multiply": lambda x, y: x * y,
-                "divide": lambda x, y: x / y if y != 0 else 0,
-                "power": lambda x, y: x ** y,
-                "modulo": lambda x, y: x % y if y != 0 else 0
-            }
-            
-            if self.operation in operations:
-                result = operations[self.operation](a, b)
-                self.set_output_value("result", result)
-                return True
-            
+        a = self.get_input_value("a")
+        b = self.get_input_value("b")
+        
+        if a is None or b is None or self._op is None:
             return False
-        except Exception:
+        
+        try:
+            result = self._op(a, b)
+        except (TypeError, OverflowError, ZeroDivisionError):
             return False
+        
+        self.set_output_value("result", result)
+        return True
 
 
 class FilterNode(ProcessNode):
@@ -56,36 +163,121 @@ class FilterNode(ProcessNode):
         self.add_output_port("filtered_data", List)
     
     def process(self) -> bool:
-        try:
-            data = self.get_input_value("data")
-            condition = self.get_input_value("condition")
-            
-            if data is None:
-                return False
-            
-            if condition is None:
-                self.set_output_value("filtered_data", data)
-                return True
-            
-            # Support callable conditions (lambda functions)
-            if callable(condition):
-                filtered = [x for x in data if condition(x)]
-            # Simple filtering logic - can be extended
-            elif condition == "positive":
-                filtered = [x for x in data if isinstance(x, (int, float)) and x > 0]
-            elif condition == "negative":
-                filtered = [x for x in data if isinstance(x, (int, float)) and x < 0]
-            elif condition == "even":
-                filtered = [x for x in data if isinstance(x, int) and x % 2 == 0]
-            elif condition == "odd":
-                filtered = [x for x in data if isinstance(x, int) and x % 2 == 1]
-            else:
-                filtered = data
-            
-            self.set_output_value("filtered_data", filtered)
+        data = self.get_input_value("data")
+        condition = self.get_input_value("condition")
+        dtype = self.get_input_dtype("data")
+        
+        if data is None:
+            return False
+        
+        if condition is None:
+            self.set_output_value("filtered_data", data, dtype=dtype)
             return True
-        except Exception:
+        
+        if not isinstance(data, (Sequence, np.ndarray)):
             return False
+        
+        # Support callable conditions (lambda functions)
+        if callable(condition):
+            filtered = [x for x in data if condition(x)]
+        elif not isinstance(condition, str):
+            filtered = data
+        else:
+            filtered = self._filter_vectorized(data, condition, dtype)
+            if filtered is None:
+                predicate = _FILTER_PREDICATES.get(condition)
+                filtered = [x for x in data if predicate(x)] if predicate else data
+        
+        # Filtering only drops items, so the element type carries over
+        self.set_output_value("filtered_data", filtered, dtype=dtype)
+        return True
+    
+    @staticmethod
+    def _filter_vectorized(data, condition: str, dtype: str = None):
+        """Evaluate a named condition as one numpy mask; None means use the per-item path"""
+        mask_fn = _MASK_PREDICATES.get(condition)
+        if mask_fn is None:
+            return None
+        arr, positions = _split_numeric(data, dtype)
+        if arr is None:
+            return None
+        if condition in ("even", "odd") and arr.dtype.kind not in "iu":
+            return None  # only ints qualify, and ints mixed with floats can't be told apart here
+        mask = mask_fn(arr)
+        if isinstance(data, np.ndarray) and positions is None:
+            return data[mask].tolist()
+        keep = np.flatnonzero(mask) if positions is None else np.asarray(positions, dtype=np.intp)[mask]
+        # Pick the original objects so ints/bools keep their Python types
+        return list(map(data.__getitem__, keep.tolist()))
+
+
+# Largest int64 magnitude whose square still fits in int64
+_INT64_SQUARE_LIMIT = 3037000499
+
+
+# numpy dtypes for the element-type hints carried on output ports
+_HINT_DTYPES = {"int": np.int64, "float": np.float64}
+
+
+def _split_numeric(data, dtype: str = None):
+    """
+    Return ``(arr, positions)`` for the int/float items of ``data``.
+    ``positions`` is None when every item is numeric, so the array result can be
+    used as-is; otherwise it lists the indices the array values came from.
+    Returns ``(None, None)`` when the numeric items don't fit a numpy dtype.
+    A ``dtype`` hint from the upstream port skips the per-item type probing.
+    """
+    if isinstance(data, np.ndarray) and data.ndim == 1 and data.dtype.kind in "iuf":
+        return data, None
+    if dtype in _HINT_DTYPES:
+        try:
+            return np.asarray(data, dtype=_HINT_DTYPES[dtype]), None
+        except (TypeError, ValueError, OverflowError):
+            pass  # hint didn't hold; probe the items below
+    try:
+        arr = np.asarray(data)
+    except (TypeError, ValueError):  # ragged / nested input
+        arr = None
+    positions = None
+    if arr is None or arr.ndim != 1 or arr.dtype.kind not in "iufb":
+        positions = [i for i, x in enumerate(data) if isinstance(x, (int, float))]
+        arr = np.asarray([data[i] for i in positions])
+    if arr.dtype.kind == "b":
+        arr = arr.astype(np.int64)
+    if arr.size and arr.dtype.kind not in "iuf":
+        return None, None
+    return arr, positions
+
+
+def _apply_where(arr, mask, kernel):
+    """Apply ``kernel`` to the masked items only, leaving the rest untouched"""
+    if mask.all():
+        return kernel(arr)
+    out = arr.astype(object)
+    out[mask] = kernel(arr[mask])
+    return out
+
+
+def _square_array(arr):
+    if arr.dtype.kind in "iu" and np.abs(arr).max() > _INT64_SQUARE_LIMIT:
+        arr = arr.astype(object)  # keep exact Python int results
+    return np.square(arr)
+
+
+def _normalize_array(arr):
+    min_val, max_val = arr.min(), arr.max()
+    range_val = max_val - min_val if max_val != min_val else 1
+    return (arr - min_val) / range_val
+
+
+# transform_type -> numpy kernel over a non-empty numeric array; bound once per TransformNode
+_ARRAY_TRANSFORMS = {
+    "square": _square_array,
+    "sqrt": lambda arr: _apply_where(arr, arr >= 0, np.sqrt),
+    "abs": np.abs,
+    "log": lambda arr: _apply_where(arr, arr > 0, np.log),
+    "normalize": _normalize_array,
+}
 
 
 class TransformNode(ProcessNode):
@@ -94,40 +286,60 @@ class TransformNode(ProcessNode):
         super().__init__(f"Transform ({transform_type})")
         self.transform_type = transform_type
         self.type = f"transform_{transform_type}"
+        self._kernel = _ARRAY_TRANSFORMS.get(transform_type)
+        self._item_fn = _ITEM_TRANSFORMS.get(transform_type)
+        self._keeps_dtype = transform_type == "abs"
         self.add_input_port("data", List)
         self.add_output_port("transformed_data", List)
         self.properties = {"transform_type": transform_type}  # Add properties for TransformNode
     
     def process(self) -> bool:
-        try:
-            data = self.get_input_value("data")
-            
-            if data is None:
-                return False
-            
-            if self.transform_type == "square":
-                transformed = [x**2 if isinstance(x, (int, float)) else x for x in data]
-            elif self.transform_type == "sqrt":
-                transformed = [x**0.5 if isinstance(x, (int, float)) and x >= 0 else x for x in data]
-            elif self.transform_type == "abs":
-                transformed = [abs(x) if isinstance(x, (int, float)) else x for x in data]
-            elif self.transform_type == "log":
-                transformed = [np.log(x) if isinstance(x, (int, float)) and x > 0 else x for x in data]
-            elif self.transform_type == "normalize":
-                numeric_data = [x for x in data if isinstance(x, (int, float))]
-                if numeric_data:
-                    min_val, max_val = min(numeric_data), max(numeric_data)
-                    range_val = max_val - min_val if max_val != min_val else 1
-                    transformed = [(x - min_val) / range_val if isinstance(x, (int, float)) else x for x in data]
-                else:
-                    transformed = data
-            else:
-                transformed = data
-            
-            self.set_output_value("transformed_data", transformed)
-            return True
-        except Exception:
+        data = self.get_input_value("data")
+        
+        if data is None or not isinstance(data, (Sequence, np.ndarray)):
             return False
+        
+        dtype = self.get_input_dtype("data")
+        transformed = self._transform_vectorized(data, dtype)
+        if transformed is None:
+            transformed = self._transform_items(data)
+        
+        # abs keeps the element type; the other transforms may mix ints and floats
+        self.set_output_value("transformed_data", transformed,
+                              dtype=dtype if self._keeps_dtype else None)
+        return True
+    
+    def _transform_vectorized(self, data, dtype: str = None):
+        """Run the transform as a single numpy kernel; None means use the per-item path"""
+        if self._kernel is None:
+            return data
+        
+        arr, positions = _split_numeric(data, dtype)
+        if arr is None:
+            return None
+        if arr.size == 0:
+            return list(data)
+        
+        out = self._kernel(arr)
+        
+        if positions is None:
+            return out.tolist()
+        transformed = list(data)
+        for i, value in zip(positions, out.tolist()):
+            transformed[i] = value
+        return transformed
+    
+    def _transform_items(self, data):
+        """Per-item fallback for inputs numpy can't hold (e.g. ints beyond int64)"""
+        if self._item_fn is not None:
+            return [self._item_fn(x) for x in data]
+        elif self.transform_type == "normalize":
+            numeric_data = [x for x in data if isinstance(x, (int, float))]
+            if numeric_data:
+                min_val, max_val = min(numeric_data), max(numeric_data)
+                range_val = max_val - min_val if max_val != min_val else 1
+                return [(x - min_val) / range_val if isinstance(x, (int, float)) else x for x in data]
+        return data
 
 
 class AggregateNode(ProcessNode):
@@ -136,41 +348,171 @@ class AggregateNode(ProcessNode):
         super().__init__(f"Aggregate ({operation})")
         self.operation = operation
         self.type = f"aggregate_{operation}"
+        self._reduce = _AGGREGATE_OPERATIONS.get(operation)
         self.add_input_port("data", List)
         self.add_output_port("result", (int, float))
         self.properties = {"operation": operation}  # Add properties for AggregateNode
     
+    def process(self) -> bool:
+        data = self.get_input_value("data")
+        
+        if data is None or not isinstance(data, (Sequence, np.ndarray)):
+            return False
+        
+        result = self.aggregate(data, self.get_input_dtype("data"))
+        if result is None:
+            return False
+        
+        self.set_output_value("result", result)
+        return True
+    
+    def aggregate(self, data, dtype: str = None):
+        """Reduce ``data`` to a single value, or None if nothing numeric can be aggregated"""
+        operation = self._reduce
+        if operation is None:
+            return None
+        
+        arr, _ = _split_numeric(data, dtype)
+        if arr is None:
+            # Numeric items numpy can't hold (e.g. ints beyond int64): reduce in Python
+            numeric_data = [x for x in data if isinstance(x, (int, float))]
+            if not numeric_data:
+                return None
+            return _PY_AGGREGATE_OPERATIONS[self.operation](numeric_data)
+        
+        if arr.size == 0:
+            return None
+        result = operation(arr)
+        # Hand plain Python scalars downstream (int stays int for sum/min/max)
+        return result.item() if isinstance(result, np.generic) else result
+
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _sum_array(arr):
+    # Integer sums that could wrap around int64 are done exactly with Python ints
+    if arr.dtype.kind in "iu" and arr.size:
+        bound = max(abs(int(arr.min())), abs(int(arr.max())))
+        if bound * arr.size > _INT64_MAX:
+            return sum(arr.tolist())
+    return np.sum(arr)
+
+
+_AGGREGATE_OPERATIONS = {
+    "sum": _sum_array,
+    "mean": np.mean,
+    "min": np.min,
+    "max": np.max,
+    "count": np.size,
+    "std": np.std,
+    "median": np.median,
+}
+
+_PY_AGGREGATE_OPERATIONS = {
+    "sum": sum,
+    "mean": lambda x: sum(x) / len(x),
+    "min": min,
+    "max": max,
+    "count": len,
+    "std": lambda x: np.std(x),
+    "median": lambda x: np.median(x),
+}
+
+
+# Per-item equivalents of FilterNode conditions and TransformNode types, used when fusing chains
+_FILTER_PREDICATES = {
+    "positive": lambda x: isinstance(x, (int, float)) and x > 0,
+    "negative": lambda x: isinstance(x, (int, float)) and x < 0,
+    "even": lambda x: isinstance(x, int) and x % 2 == 0,
+    "odd": lambda x: isinstance(x, int) and x % 2 == 1,
+}
+
+# Vectorized forms of the named FilterNode conditions over a numeric ndarray
+_MASK_PREDICATES = {
+    "positive": lambda a: a > 0,
+    "negative": lambda a: a < 0,
+    "even": lambda a: a % 2 == 0,
+    "odd": lambda a: a % 2 == 1,
+}
+
+_ITEM_TRANSFORMS = {
+    "square": lambda x: x**2 if isinstance(x, (int, float)) else x,
+    "sqrt": lambda x: x**0.5 if isinstance(x, (int, float)) and x >= 0 else x,
+    "abs": lambda x: abs(x) if isinstance(x, (int, float)) else x,
+    "log": lambda x: np.log(x) if isinstance(x, (int, float)) and x > 0 else x,
+}
+
+
+class FusedMapFilterReduceNode(ProcessNode):
+    """
+    Runs a linear Filter/Transform chain (optionally ending in an Aggregate) in a single pass.
+    Built by fuse_linear_chains(); it shares the head node's "data" input port and the
+    tail node's output port, so surrounding connections keep working unchanged. The ports
+    are the same NodePort objects, not copies: running the fused node also overwrites the
+    head's input value and the tail's output value on the original nodes.
+    """
+    def __init__(self, chain: List[ProcessNode]):
+        super().__init__("Fused (" + " > ".join(node.name for node in chain) + ")")
+        self.type = "fused"
+        self.chain = chain
+        head, tail = chain[0], chain[-1]
+        self.input_ports["data"] = head.input_ports["data"]
+        self._output_name = next(iter(tail.output_ports))
+        self.output_ports[self._output_name] = tail.output_ports[self._output_name]
+        self._reducer = tail if isinstance(tail, AggregateNode) else None
+        self._steps = []
+        for node in chain:
+            if isinstance(node, FilterNode):
+                condition = node.get_input_value("condition")
+                # Same dispatch as FilterNode.process: callables run as-is, only strings name a predicate,
+                # anything else (e.g. a dict/list from JSON) passes the data through
+                if callable(condition):
+                    predicate = condition
+                elif isinstance(condition, str):
+                    predicate = _FILTER_PREDICATES.get(condition)
+                else:
+                    predicate = None
+                if predicate is not None:
+                    self._steps.append((True, predicate))
+            elif isinstance(node, TransformNode):
+                transform = _ITEM_TRANSFORMS.get(node.transform_type)
+                if transform is not None:
+                    self._steps.append((False, transform))
+    
     def process(self) -> bool:
         try:
             data = self.get_input_value("data")
             
             if data is None:
                 return False
+            if isinstance(data, np.ndarray):
+                data = data.tolist()  # per-item steps type-check Python scalars
             
-            # Filter numeric data
-            numeric_data = [x for x in data if isinstance(x, (int, float))]
-            
-            if not numeric_data:
-                return False
-            
-            operations = {
-                "sum": sum,
-                "mean": lambda x: sum(x) / len(x),
-                "min": min,
-                "max": max,
-                "count": len,
-                "std": lambda x: np.std(x),
-                "median": lambda x: np.median(x)
-            }
+            values = []
+            append = values.append
+            steps = self._steps
+            for x in data:
+                for is_filter, fn in steps:
+                    if is_filter:
+                        if not fn(x):
+                            break
+                    else:
+                        x = fn(x)
+                else:
+                    append(x)
             
-            if self.operation in operations:
-                result = operations[self.operation](numeric_data)
-                self.set_output_value("result", result)
+            if self._reducer is None:
+                self.set_output_value(self._output_name, values)
                 return True
             
-            return False
-        except Exception:
-            return False
+            result = self._reducer.aggregate(values)
+            if result is None:
+                return False
+            self.set_output_value(self._output_name, result)
+            return True
+        except (TypeError, ValueError, ArithmeticError):
+            return False  # items the chain's steps can't handle
 
 
 class JoinNode(ProcessNode):
@@ -184,16 +526,55 @@ class JoinNode(ProcessNode):
     
     def process(self) -> bool:
         try:
-            data1 = self.get_input_value("data1") or []
-            data2 = self.get_input_value("data2") or []
+            data1 = self.get_input_value("data1")
+            data2 = self.get_input_value("data2")
+            if data1 is None:
+                data1 = []
+            if data2 is None:
+                data2 = []
             
-            joined = list(data1) + list(data2)
+            if isinstance(data1, np.ndarray) and isinstance(data2, np.ndarray):
+                joined = np.concatenate((data1, data2))
+            else:
+                joined = [*data1, *data2]  # one allocation instead of two copies plus a concat
             self.set_output_value("joined_data", joined)
             return True
         except Exception:
             return False
 
 
+class LazyListSlice(Sequence):
+    """Read-only view of data[lo:hi] without copying; only safe over immutable sequences"""
+    def __init__(self, data: Sequence, lo: int, hi: int):
+        self._data = data
+        self._range = range(*slice(lo, hi).indices(len(data)))
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = LazyListSlice.__new__(LazyListSlice)
+            view._data = self._data
+            view._range = self._range[index]
+            return view
+        return self._data[self._range[index]]
+
+    def __iter__(self):
+        step = self._range.step
+        if step > 0:
+            return islice(self._data, self._range.start, self._range.stop, step)
+        return (self._data[i] for i in self._range)  # islice can't walk backwards
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class SplitNode(ProcessNode):
     """Splits data into multiple streams"""
     def __init__(self):
@@ -212,8 +593,14 @@ class SplitNode(ProcessNode):
             if data is None:
                 return False
             
-            data1 = data[:split_index]
-            data2 = data[split_index:]
+            if isinstance(data, tuple):
+                # Immutable input: hand out views instead of copying both halves
+                data1 = LazyListSlice(data, 0, split_index)
+                data2 = LazyListSlice(data, split_index, len(data))
+            else:
+                # ndarray slices are already views; lists are copied since they may be mutated later
+                data1 = data[:split_index]
+                data2 = data[split_index:]
             
             self.set_output_value("data1", data1)
             self.set_output_value("data2", data2)
@@ -230,25 +617,263 @@ class PrintNode(ProcessNode):
         self.add_input_port("data", Any)
         self.add_output_port("data", Any)  # Pass-through
     
+    @property
+    def _short_id(self) -> str:
+        # Derived on use: loading a pipeline reassigns node.id after construction
+        return self.id.split('-', 1)[0]
+    
     def process(self) -> bool:
         try:
             data = self.get_input_value("data")
-            print(f"[{self.name} - {self.id.split('-')[0]}] {data}")
+            # One write per call (print() issues separate writes for the text and the newline)
+            sys.stdout.write(f"[{self.name} - {self._short_id}] {data}\n")
             self.set_output_value("data", data)
             return True
         except Exception:
             return False
 
 
+def _mock_text(size, min_length, max_length, source):
+    text = source.providers()["text"]
+    draw = text.text
+    if not (min_length and max_length):
+        return [draw(quantity=1)[0] for _ in range(size)]
+    
+    # Length-constrained: padding words come from one pool shared by every item,
+    # refilled in bulk, instead of a fresh words() draw per short item
+    words = text.words
+    pool, i = [], 0
+    mock_data = []
+    for _ in range(size):
+        data = draw(quantity=1)[0][:max_length]
+        if len(data) < min_length:
+            # Join once instead of growing the string per word
+            parts = [data]
+            total = len(data)
+            while total < min_length:
+                if i == len(pool):
+                    pool, i = words(quantity=(min_length // 5 + 4) * size), 0
+                parts.append(pool[i])
+                total += 1 + len(pool[i])
+                i += 1
+            data = " ".join(parts)[:max_length]
+        mock_data.append(data)
+    return mock_data
+
+
+def _mock_word(size, min_length, max_length, source):
+    text = source.providers()["text"]
+    mock_data = []
+    for _ in range(size):
+        data = text.word()
+        if min_length and len(data) < min_length:
+            data = text.words(quantity=2, separator=" ")
+        if max_length and len(data) > max_length:
+            data = data[:max_length]
+        mock_data.append(data)
+    return mock_data
+
+
+def _mock_sentence(size, min_length, max_length, source):
+    sentence = source.providers()["text"].sentence
+    if max_length:
+        return [sentence()[:max_length] for _ in range(size)]
+    return list(starmap(sentence, repeat((), size)))
+
+
+def _mock_password(size, min_length, max_length, source):
+    password = source.providers()["internet"].password
+    length = max_length or 12
+    return [password(length=length) for _ in range(size)]
+
+
+def _mock_date(size, min_length, max_length, source):
+    date = source.providers()["datetime"].date
+    return [date().isoformat() for _ in range(size)]
+
+
+def _mock_datetime(size, min_length, max_length, source):
+    datetime = source.providers()["datetime"].datetime
+    return [datetime().isoformat() for _ in range(size)]
+
+
+# The numeric and boolean generators return packed ndarrays (8 bytes per number, 1 per flag),
+# whichever RNG drew them; MockNode converts them to lists unless return_numpy is set
+def _draw_integers(size, low, high, source):
+    """``size`` ints in [low, high), rejecting an empty range on both the small and the bulk path"""
+    if low >= high:
+        raise ValueError(f"min_length {low} is greater than max_length {high - 1}")
+    if size < _SMALL_BATCH:
+        return np.array(source.small_rng.integers(low, high, size), dtype=np.int64)
+    return source.rng.integers(low, high, size)
+
+
+def _mock_age(size, min_length, max_length, source):
+    return _draw_integers(size, min_length or 18, (max_length or 80) + 1, source)
+
+
+def _mock_integer(size, min_length, max_length, source):
+    return _draw_integers(size, min_length or 1, (max_length or 100) + 1, source)
+
+
+def _mock_float(size, min_length, max_length, source):
+    if size < _SMALL_BATCH:
+        values = np.array(source.small_rng.uniform(min_length or 0.0, max_length or 100.0, size), dtype=np.float64)
+    else:
+        values = source.rng.uniform(min_length or 0.0, max_length or 100.0, size)
+    return np.round(values, 2)
+
+
+def _mock_boolean(size, min_length, max_length, source):
+    if size < _SMALL_BATCH:
+        bits = source.small_rng.draws(1)[0]  # one 64-bit word covers the whole batch
+        return np.array([bits >> i & 1 for i in range(size)], dtype=np.bool_)
+    # One random bit per flag: draw ceil(size/8) bytes in bulk and unpack them
+    packed = np.frombuffer(source.rng.bytes((size + 7) // 8), dtype=np.uint8)
+    return np.unpackbits(packed, count=size).view(np.bool_)
+
+
+def _mock_uuid(size, min_length, max_length, source):
+    # One bulk draw of random bytes instead of an os.urandom call per uuid4(); version=4 sets the bits
+    raw = source.rng.bytes(16 * size)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * size, 16)]
+
+
+def _mock_provider(provider: str, method: str):
+    """Build a generator that calls one Mimesis provider method ``size`` times"""
+    def generate(size, min_length, max_length, source):
+        fn = getattr(source.providers()[provider], method)
+        # starmap over empty argument tuples calls fn() from C, with no per-item bytecode
+        return list(starmap(fn, repeat((), size)))
+    return generate
+
+
+# Pooled provider values: drawn _POOL_CHUNK at a time and each handed out once, so values are
+# as unique as the provider makes them. Batches under _SMALL_BATCH skip the pool entirely.
+_POOL_CHUNK = 256
+
+
+def _mock_pooled(provider: str, method: str):
+    """Like _mock_provider, but serve medium/large batches from a pool refilled in chunks"""
+    direct = _mock_provider(provider, method)
+    pool = []
+    cursor = [0]
+    lock = threading.Lock()
+    def generate(size, min_length, max_length, source):
+        if not source.pooled or size < _SMALL_BATCH:
+            return direct(size, min_length, max_length, source)
+        with lock:
+            start = cursor[0]
+            if len(pool) - start < size:
+                del pool[:start]  # drop the values already handed out
+                start = 0
+                pool.extend(direct(max(size - len(pool), _POOL_CHUNK), min_length, max_length, source))
+            cursor[0] = start + size
+            return pool[start:start + size]
+    return generate
+
+
+# data_type -> generator(size, min_length, max_length, source); resolved once per MockNode
+_MOCK_GENERATORS = {
+    "text": _mock_text,
+    "word": _mock_word,
+    "sentence": _mock_sentence,
+    "first_name": _mock_pooled("person", "first_name"),
+    "last_name": _mock_pooled("person", "last_name"),
+    "full_name": _mock_provider("person", "full_name"),
+    "email": _mock_pooled("person", "email"),
+    "phone": _mock_provider("person", "phone_number"),
+    "age": _mock_age,
+    "integer": _mock_integer,
+    "float": _mock_float,
+    "date": _mock_date,
+    "datetime": _mock_datetime,
+    "address": _mock_pooled("address", "address"),
+    "city": _mock_provider("address", "city"),
+    "country": _mock_provider("address", "country"),
+    "zipcode": _mock_provider("address", "zip_code"),
+    "url": _mock_pooled("internet", "url"),
+    "username": _mock_provider("internet", "username"),
+    "password": _mock_password,
+    "uuid": _mock_uuid,
+    "boolean": _mock_boolean,
+    "programming_language": _mock_provider("dev", "programming_language"),
+    "database": _mock_provider("dev", "database"),
+    "os": _mock_provider("dev", "os"),
+}
+
+# Unknown data types default to generic words
+_mock_default = _mock_provider("text", "word")
+
+# Seeded output can also persist across runs in a shelve file named by $MOCKD_CACHE (off when unset).
+# Bump the version whenever a generator's output for a given seed changes, so old entries stop matching.
+_MOCK_CACHE_VERSION = 4
+_MOCK_CACHE_PATH = os.environ.get("MOCKD_CACHE")
+
+
+def _mock_cache_key(*params) -> str:
+    """Stable short digest of the generation parameters, usable as a shelve key"""
+    return hashlib.blake2b(repr((_MOCK_CACHE_VERSION,) + params).encode(), digest_size=8).hexdigest()
+
+
+def _load_cached_mock(key):
+    try:
+        with shelve.open(_MOCK_CACHE_PATH, flag="r") as shelf:
+            return shelf.get(key)
+    except (OSError, pickle.UnpicklingError, *dbm.error):
+        return None  # no cache file yet, or unreadable: regenerate
+
+
+def _store_cached_mock(key, data):
+    try:
+        with shelve.open(_MOCK_CACHE_PATH) as shelf:
+            shelf[key] = data
+    except (OSError, *dbm.error) as e:
+        print(f"Could not write mock data cache {_MOCK_CACHE_PATH}: {e}")
+
+
+def _generate_seeded(data_type, size, min_length, max_length, seed):
+    """Run the generator on a private source seeded from ``seed``; shared state is never touched"""
+    generator = _MOCK_GENERATORS.get(data_type, _mock_default)
+    return generator(size, min_length, max_length, _seeded_source(seed))
+
+
+@lru_cache(maxsize=256)
+def _seeded_mock_data(data_type, size, min_length, max_length, seed):
+    """Seeded mock data, cached per parameter tuple in memory and optionally on disk"""
+    key = None
+    data = None
+    if _MOCK_CACHE_PATH:
+        key = _mock_cache_key(data_type, size, min_length, max_length, seed)
+        data = _load_cached_mock(key)
+    if data is None:
+        data = _generate_seeded(data_type, size, min_length, max_length, seed)
+        if key is not None:
+            _store_cached_mock(key, data)
+    if isinstance(data, np.ndarray):
+        data.flags.writeable = False  # the cached copy is shared
+        return data
+    return tuple(data)
+
+
+# Element-type hints for the numeric generators, so downstream nodes can skip type probing
+_MOCK_DTYPES = {"age": "int", "integer": "int", "float": "float"}
+
+
 class MockNode(ProcessNode):
     """Generates mock data using Mimesis library"""
-    def __init__(self, data_type: str = "text", size: int = 10, min_length: int = 10, max_length: int = 25):
+    def __init__(self, data_type: str = "text", size: int = 10, min_length: int = 10, max_length: int = 25,
+                 return_numpy: bool = True, seed: int = None):
         super().__init__(f"Mock ({data_type})")
         self.data_type = data_type
         self.type = f"mock_{data_type}" if data_type else "mock"
         self.size = size
         self.min_length = min_length
         self.max_length = max_length
+        self.return_numpy = return_numpy  # Keep numeric output as an ndarray instead of boxed Python numbers
+        self.seed = seed  # Fixed seed: reproducible output, shared by identical nodes via a cache
+        self._generator = _MOCK_GENERATORS.get(data_type, _mock_default)
+        self._dtype = _MOCK_DTYPES.get(data_type)
         
         # Add configuration input ports
         self.add_input_port("size", int)  # Override default size
@@ -269,139 +894,32 @@ class MockNode(ProcessNode):
     
     def process(self) -> bool:
         try:
-            # Import Mimesis here to avoid import issues
-            from mimesis import Generic, Person, Text, Numeric, Datetime, Address, Internet, Development
-            
             # Get configuration from inputs or use defaults
             size = self.get_input_value("size") or self.size
             min_length = self.get_input_value("min_length") or self.min_length
             max_length = self.get_input_value("max_length") or self.max_length
             
-            # Initialize Mimesis providers
-            generic = Generic()
-            person = Person()
-            text = Text()
-            numeric = Numeric()
-            datetime_provider = Datetime()
-            address = Address()
-            internet = Internet()
-            dev = Development()
-            
-            mock_data = []
-            
-            for _ in range(size):
-                if self.data_type == "text":
-                    if min_length and max_length:
-                        data = text.text(quantity=1)[0][:max_length]
-                        while len(data) < min_length:
-                            data += " " + text.word()
-                        data = data[:max_length]
-                    else:
-                        data = text.text(quantity=1)[0]
-                    mock_data.append(data)
-                
-                elif self.data_type == "word":
-                    data = text.word()
-                    if min_length and len(data) < min_length:
-                        data = text.words(quantity=2, separator=" ")
-                    if max_length and len(data) > max_length:
-                        data = data[:max_length]
-                    mock_data.append(data)
-                
-                elif self.data_type == "sentence":
-                    data = text.sentence()
-                    if max_length and len(data) > max_length:
-                        data = data[:max_length]
-                    mock_data.append(data)
-                
-                elif self.data_type == "first_name":
-                    mock_data.append(person.first_name())
-                
-                elif self.data_type == "last_name":
-                    mock_data.append(person.last_name())
-                
-                elif self.data_type == "full_name":
-                    mock_data.append(person.full_name())
-                
-                elif self.data_type == "email":
-                    mock_data.append(person.email())
-                
-                elif self.data_type == "phone":
-                    mock_data.append(person.phone_number())
-                
-                elif self.data_type == "age":
-                    min_val = min_length or 18
-                    max_val = max_length or 80
-                    mock_data.append(numeric.integer_number(start=min_val, end=max_val))
-                
-                elif self.data_type == "integer":
-                    min_val = min_length or 1
-                    max_val = max_length or 100
-                    mock_data.append(numeric.integer_number(start=min_val, end=max_val))
-                
-                elif self.data_type == "float":
-                    min_val = min_length or 0.0
-                    max_val = max_length or 100.0
-                    mock_data.append(round(numeric.float_number(start=min_val, end=max_val), 2))
-                
-                elif self.data_type == "date":
-                    mock_data.append(datetime_provider.date().isoformat())
-                
-                elif self.data_type == "datetime":
-                    mock_data.append(datetime_provider.datetime().isoformat())
-                
-                elif self.data_type == "address":
-                    mock_data.append(address.address())
-                
-                elif self.data_type == "city":
-                    mock_data.append(address.city())
-                
-                elif self.data_type == "country":
-                    mock_data.append(address.country())
-                
-                elif self.data_type == "zipcode":
-                    mock_data.append(address.zip_code())
-                
-                elif self.data_type == "url":
-                    mock_data.append(internet.url())
-                
-                elif self.data_type == "username":
-                    mock_data.append(internet.username())
-                
-                elif self.data_type == "password":
-                    length = max_length or 12
-                    mock_data.append(internet.password(length=length))
-                
-                elif self.data_type == "uuid":
-                    import uuid
-                    mock_data.append(str(uuid.uuid4()))
-                
-                elif self.data_type == "boolean":
-                    import random
-                    mock_data.append(random.choice([True, False]))
-                
-                elif self.data_type == "programming_language":
-                    mock_data.append(dev.programming_language())
-                
-                elif self.data_type == "database":
-                    mock_data.append(dev.database())
-                
-                elif self.data_type == "os":
-                    mock_data.append(dev.os())
-                
-                else:
-                    # Default to generic text
-                    mock_data.append(text.word())
-            
-            self.set_output_value("mock_data", mock_data)
+            if self.seed is None:
+                mock_data = self._generator(size, min_length, max_length, _SHARED_SOURCE)
+            else:
+                # Deterministic, so identical nodes reuse one generation; hand out a private copy
+                cached = _seeded_mock_data(self.data_type, size, min_length, max_length, self.seed)
+                mock_data = cached.copy() if isinstance(cached, np.ndarray) else list(cached)
+            if isinstance(mock_data, np.ndarray) and not self.return_numpy:
+                mock_data = mock_data.tolist()
+            self.set_output_value("mock_data", mock_data, dtype=self._dtype)
             return True
             
         except ImportError:
             print("Mimesis library not available. Please install it with: pip install mimesis")
             return False
-        except Exception as e:
+        except (ValueError, TypeError) as e:
             print(f"Error generating mock data: {e}")
             return False
+        except Exception as e:
+            # Provider/locale failures (KeyError, AttributeError, ...) fail this node, not the whole run
+            print(f"Error generating mock data ({self.data_type}): {type(e).__name__}: {e}")
+            return False
     
     def can_execute(self) -> bool:
         """MockNode can always execute as it has default values for all inputs"""
@@ -422,83 +940,168 @@ class ForEachNode(ProcessNode):
 
     def process(self, index) -> any:
         items = self.get_input_value("items")
-        if not isinstance(items, list):
+        if not isinstance(items, (list, np.ndarray)):
             self.set_output_value("iterate", None)
             self.set_output_value("exit", None)
             return {"continueLoop": False, "exit": False}
 
         # For pipeline execution: set 'iterate' to a generator of items
         # Downstream node should expect to receive 'item' as input for each iteration
-        self.set_output_value("iterate", items[index] if index < len(items) else None)
+        n = len(items)
+        item = items[index] if index < n else None
+        if isinstance(item, np.generic):
+            item = item.item()  # hand plain Python scalars to the per-item nodes
+        self.set_output_value("iterate", item)
         self.set_output_value("exit", True)  # Just a signal; downstream can use or ignore
-        continueLoop = index < len(items) - 1  # Continue if there are more items to process
+        continueLoop = index < n - 1  # Continue if there are more items to process
         exitLoop = not continueLoop  # Exit if no more items to process
         return {"continueLoop": continueLoop, "exit": exitLoop}
 
+def _next_in_chain(pipeline: Pipeline, node: ProcessNode, outgoing: Dict[str, List[Connection]]):
+    """Return the node fed exclusively by ``node`` if the pair can be fused, else None"""
+    if isinstance(node, TransformNode):
+        if node.transform_type not in _ITEM_TRANSFORMS:
+            return None
+    elif not isinstance(node, FilterNode) or node.get_input_port("condition").connected_to is not None:
+        return None  # not fusable, or the filter condition is only known at run time
+    conns = outgoing.get(node.id, [])
+    if len(conns) != 1 or conns[0].target_port != "data":
+        return None
+    target = pipeline.nodes.get(conns[0].target_node_id)
+    if isinstance(target, FilterNode):
+        return target if target.get_input_port("condition").connected_to is None else None
+    if isinstance(target, TransformNode):
+        return target if target.transform_type in _ITEM_TRANSFORMS else None
+    if isinstance(target, AggregateNode):
+        return target
+    return None
+
+
+def fuse_linear_chains(pipeline: Pipeline) -> Pipeline:
+    """
+    Return a copy of ``pipeline`` where each linear Filter/Transform(/Aggregate) chain is
+    replaced by one FusedMapFilterReduceNode, so the data is traversed once per chain.
+    The original pipeline's node and connection tables are not modified, but each fused node
+    reuses its chain's head input port and tail output port, so executing the copy writes
+    into those ports on the original nodes. Intermediate chain nodes will not appear in the
+    results of the fused copy. Usage: ``fuse_linear_chains(pipeline).execute()``
+    """
+    outgoing: Dict[str, List[Connection]] = {}
+    for conn in pipeline.connections.values():
+        outgoing.setdefault(conn.source_node_id, []).append(conn)
+    
+    successor = {}
+    for node_id, node in pipeline.nodes.items():
+        nxt = _next_in_chain(pipeline, node, outgoing)
+        if nxt is not None:
+            successor[node_id] = nxt
+    has_predecessor = {nxt.id for nxt in successor.values()}
+    
+    # Map every fused chain member to the fused node replacing it
+    replaced: Dict[str, ProcessNode] = {}
+    for node_id in successor:
+        if node_id in has_predecessor:
+            continue
+        chain = [pipeline.nodes[node_id]]
+        while chain[-1].id in successor:
+            chain.append(successor[chain[-1].id])
+        fused = FusedMapFilterReduceNode(chain)
+        for member in chain:
+            replaced[member.id] = fused
+    
+    fused_pipeline = Pipeline(pipeline.name)
+    for node_id, node in pipeline.nodes.items():
+        target = replaced.get(node_id, node)
+        if target.id not in fused_pipeline.nodes:
+            fused_pipeline.add_node(target)  # fused node takes the head's place in execution order
+    for conn in pipeline.connections.values():
+        source = replaced.get(conn.source_node_id)
+        target = replaced.get(conn.target_node_id)
+        if source is not None and source is target:
+            continue  # internal to a fused chain
+        fused_pipeline.connections[conn.id] = Connection(
+            id=conn.id,
+            source_node_id=source.id if source else conn.source_node_id,
+            source_port=conn.source_port,
+            target_node_id=target.id if target else conn.target_node_id,
+            target_port=conn.target_port
+        )
+    return fused_pipeline
+
 # Node factory for easy node creation
 NODE_TYPES = {
-    "true": lambda: TrueNode("True"),
-    "false": lambda: FalseNode("False"),
-    "data": lambda: DataNode("data"),
-    "array": lambda: ArrayNode("array"),
-    "forEach": lambda: ForEachNode("forEach"),
-    "add": lambda: MathNode("add"),
-    "subtract": lambda: MathNode("subtract"),
-    "multiply": lambda: MathNode("multiply"),
-    "divide": lambda: MathNode("divide"),
-    "power": lambda: MathNode("power"),
-    "modulo": lambda: MathNode("modulo"),
-    "filter": lambda: FilterNode(),
-    "transform_square": lambda: TransformNode("square"),
-    "transform_sqrt": lambda: TransformNode("sqrt"),
-    "transform_abs": lambda: TransformNode("abs"),
-    "transform_normalize": lambda: TransformNode("normalize"),
-    "aggregate_sum": lambda: AggregateNode("sum"),
-    "aggregate_mean": lambda: AggregateNode("mean"),
-    "aggregate_min": lambda: AggregateNode("min"),
-    "aggregate_max": lambda: AggregateNode("max"),
-    "join": lambda: JoinNode(),
-    "split": lambda: SplitNode(),
-    "print": lambda: PrintNode(),
+    "true": partial(TrueNode, "True"),
+    "false": partial(FalseNode, "False"),
+    "data": partial(DataNode, "data"),
+    "array": partial(ArrayNode, "array"),
+    "forEach": partial(ForEachNode, "forEach"),
+    "add": partial(MathNode, "add"),
+    "subtract": partial(MathNode, "subtract"),
+    "multiply": partial(MathNode, "multiply"),
+    "divide": partial(MathNode, "divide"),
+    "power": partial(MathNode, "power"),
+    "modulo": partial(MathNode, "modulo"),
+    "filter": FilterNode,
+    "transform_square": partial(TransformNode, "square"),
+    "transform_sqrt": partial(TransformNode, "sqrt"),
+    "transform_abs": partial(TransformNode, "abs"),
+    "transform_normalize": partial(TransformNode, "normalize"),
+    "aggregate_sum": partial(AggregateNode, "sum"),
+    "aggregate_mean": partial(AggregateNode, "mean"),
+    "aggregate_min": partial(AggregateNode, "min"),
+    "aggregate_max": partial(AggregateNode, "max"),
+    "join": JoinNode,
+    "split": SplitNode,
+    "print": PrintNode,
     # Mock data generators - Basic
-    "mock": lambda: MockNode(),
-    "mock_text": lambda: MockNode("text", 10),
-    "mock_word": lambda: MockNode("word", 10),
-    "mock_sentence": lambda: MockNode("sentence", 10),
+    "mock": MockNode,
+    "mock_text": partial(MockNode, "text", 10),
+    "mock_word": partial(MockNode, "word", 10),
+    "mock_sentence": partial(MockNode, "sentence", 10),
     # Mock data generators - Personal
-    "mock_first_names": lambda: MockNode("first_name", 10),
-    "mock_last_names": lambda: MockNode("last_name", 10),
-    "mock_full_names": lambda: MockNode("full_name", 10),
-    "mock_emails": lambda: MockNode("email", 10),
-    "mock_phones": lambda: MockNode("phone", 10),
-    "mock_ages": lambda: MockNode("age", 10),
+    "mock_first_names": partial(MockNode, "first_name", 10),
+    "mock_last_names": partial(MockNode, "last_name", 10),
+    "mock_full_names": partial(MockNode, "full_name", 10),
+    "mock_emails": partial(MockNode, "email", 10),
+    "mock_phones": partial(MockNode, "phone", 10),
+    "mock_ages": partial(MockNode, "age", 10),
     # Mock data generators - Numbers
-    "mock_integers": lambda: MockNode("integer", 10),
-    "mock_floats": lambda: MockNode("float", 10),
-    "mock_booleans": lambda: MockNode("boolean", 10),
+    "mock_integers": partial(MockNode, "integer", 10),
+    "mock_floats": partial(MockNode, "float", 10),
+    "mock_booleans": partial(MockNode, "boolean", 10),
     # Mock data generators - Dates
-    "mock_dates": lambda: MockNode("date", 10),
-    "mock_datetimes": lambda: MockNode("datetime", 10),
+    "mock_dates": partial(MockNode, "date", 10),
+    "mock_datetimes": partial(MockNode, "datetime", 10),
     # Mock data generators - Address
-    "mock_addresses": lambda: MockNode("address", 10),
-    "mock_cities": lambda: MockNode("city", 10),
-    "mock_countries": lambda: MockNode("country", 10),
-    "mock_zipcodes": lambda: MockNode("zipcode", 10),
+    "mock_addresses": partial(MockNode, "address", 10),
+    "mock_cities": partial(MockNode, "city", 10),
+    "mock_countries": partial(MockNode, "country", 10),
+    "mock_zipcodes": partial(MockNode, "zipcode", 10),
     # Mock data generators - Internet
-    "mock_urls": lambda: MockNode("url", 10),
-    "mock_usernames": lambda: MockNode("username", 10),
-    "mock_passwords": lambda: MockNode("password", 10),
+    "mock_urls": partial(MockNode, "url", 10),
+    "mock_usernames": partial(MockNode, "username", 10),
+    "mock_passwords": partial(MockNode, "password", 10),
     # Mock data generators - Tech
-    "mock_uuids": lambda: MockNode("uuid", 10),
-    "mock_programming_languages": lambda: MockNode("programming_language", 10),
-    "mock_databases": lambda: MockNode("database", 10),
-    "mock_operating_systems": lambda: MockNode("os", 10),
+    "mock_uuids": partial(MockNode, "uuid", 10),
+    "mock_programming_languages": partial(MockNode, "programming_language", 10),
+    "mock_databases": partial(MockNode, "database", 10),
+    "mock_operating_systems": partial(MockNode, "os", 10),
 }
 
+# Built-in node type keys grouped by prefix ("mock", "transform", "aggregate", ...), built once at import
+NODE_TYPES_BY_PREFIX: Dict[str, List[str]] = {}
+for _node_type in NODE_TYPES:
+    NODE_TYPES_BY_PREFIX.setdefault(_node_type.split("_", 1)[0], []).append(_node_type)
+del _node_type
+
 
 CUSTOM_NODE_DEFINITIONS = []
 CUSTOM_NODE_TYPES = {}
 
+# Live view over custom + built-in node types (custom entries win); no copying on lookup.
+# register_custom_nodes() mutates CUSTOM_NODE_TYPES in place, so this never goes stale.
+_ALL_NODE_TYPES = ChainMap(CUSTOM_NODE_TYPES, NODE_TYPES)
+
 def register_custom_nodes(json_path="custom_nodes.json"):
     global CUSTOM_NODE_DEFINITIONS, CUSTOM_NODE_TYPES
     try:
@@ -522,7 +1125,15 @@ def register_custom_nodes(json_path="custom_nodes.json"):
         for defn in CUSTOM_NODE_DEFINITIONS:
             if isinstance(defn, dict):
                 node_type = defn.get("name", "CustomNode")
-                CUSTOM_NODE_TYPES[node_type] = lambda d=defn: JsonDefinedNode(d)
+                try:
+                    # Parse each definition once; creating a node then only wires ports
+                    template = JsonDefinedNode.compile(defn)
+                except Exception as e:
+                    # Visible on purpose: a skipped definition is missing from the palette
+                    print(f"Skipping custom node '{node_type}' from {json_path}: invalid definition "
+                          f"({type(e).__name__}: {e})")
+                    continue
+                CUSTOM_NODE_TYPES[node_type] = partial(JsonDefinedNode.from_template, template)
             
         print(f"Loaded {len(CUSTOM_NODE_DEFINITIONS)} custom node definitions")
     except Exception as e:
@@ -533,14 +1144,11 @@ register_custom_nodes()
 
 # Merge built-in and custom node types
 def get_all_node_types():
-    all_types = dict(NODE_TYPES)
-    all_types.update(CUSTOM_NODE_TYPES)
-    return all_types
+    return _ALL_NODE_TYPES
 
 def create_node(node_type: str) -> ProcessNode:
     """Factory function to create nodes by type"""
-    all_types = get_all_node_types()
-    if node_type in all_types:
-        return all_types[node_type]()
-    else:
+    factory = _ALL_NODE_TYPES.get(node_type)
+    if factory is None:
         raise ValueError(f"Unknown node type: {node_type}")
+    return factory()
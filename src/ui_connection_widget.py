@@ -1,8 +1,9 @@
 from PySide6.QtWidgets import QGraphicsItem
-from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath
+from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QPainterPathStroker
 from PySide6.QtCore import QPointF, QRectF, Qt
 from typing import Optional
 import uuid
+import numpy as np
 
 # NOTE: To ensure delete key works, NodeGraphScene must import ConnectionWidget from ui_connection_widget.py
 # In your gui.py, at the top, add:
@@ -10,8 +11,102 @@ import uuid
 #
 # This ensures isinstance(item, ConnectionWidget) works in keyPressEvent.
 
+_PEN_NORMAL = QPen(QColor(200, 200, 200), 2)
+_PEN_HOVERED = QPen(QColor(100, 255, 255), 4, Qt.DashLine)
+_PEN_SELECTED = QPen(QColor(255, 255, 100), 4)
+
+# Below this many stale connections, rebuilding one by one beats the numpy call overhead
+_BATCH_MIN = 8
+
+
+class ConnectionsLayerItem(QGraphicsItem):
+    """Paints every ConnectionWidget of a scene in one pass, switching pens once per state"""
+    def __init__(self):
+        super().__init__()
+        self.connections = set()
+        self._bbox = None
+        self.setZValue(-1)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+
+    def add_connection(self, connection):
+        self.connections.add(connection)
+        connection.setFlag(QGraphicsItem.ItemHasNoContents, True)
+        self.refresh()
+
+    def remove_connection(self, connection):
+        self.connections.discard(connection)
+        connection.setFlag(QGraphicsItem.ItemHasNoContents, False)
+        self.refresh()
+
+    def detach_all(self):
+        """Forget every connection, e.g. right before the scene deletes all items"""
+        for connection in self.connections:
+            connection._layer = None
+        self.connections.clear()
+
+    def refresh(self):
+        """Recompute bounds and repaint after a connection changed geometry"""
+        self.prepareGeometryChange()
+        self._bbox = None
+        self.update()
+
+    def _rebuild_stale(self):
+        """Rebuild every invalidated connection path at once, with control points computed in numpy"""
+        stale, coords = [], []
+        for connection in self.connections:
+            if connection._cached_path is None:
+                endpoints = connection._endpoints()
+                if endpoints is not None:
+                    source_pos, target_pos = endpoints
+                    stale.append(connection)
+                    coords.append((source_pos.x(), source_pos.y(), target_pos.x(), target_pos.y()))
+        if len(stale) < _BATCH_MIN:
+            return  # _geometry() rebuilds the few stale ones on demand
+        sx, sy, tx, ty = np.array(coords).T
+        half = (tx - sx) * 0.5
+        ctrl1_x = (sx + half).tolist()
+        ctrl2_x = (tx - half).tolist()
+        for connection, (x1, y1, x2, y2), c1, c2 in zip(stale, coords, ctrl1_x, ctrl2_x):
+            connection._build_path(x1, y1, x2, y2, c1, c2)
+
+    def boundingRect(self) -> QRectF:
+        if self._bbox is None:
+            self._rebuild_stale()
+            bbox = QRectF()
+            for connection in self.connections:
+                bbox = bbox.united(connection.boundingRect())
+            self._bbox = bbox
+        return self._bbox
+
+    def shape(self):
+        # Never the target of hit tests; the ConnectionWidgets handle those
+        return QPainterPath()
+
+    def paint(self, painter: QPainter, option, widget):
+        normal, hovered, selected = [], [], []
+        for connection in self.connections:
+            path = connection._geometry()[0]
+            if path is None:
+                continue
+            if connection.isSelected():
+                selected.append(path)
+            elif connection._hovered:
+                hovered.append(path)
+            else:
+                normal.append(path)
+        for pen, paths in ((_PEN_NORMAL, normal), (_PEN_HOVERED, hovered), (_PEN_SELECTED, selected)):
+            if paths:
+                painter.setPen(pen)
+                for path in paths:
+                    painter.drawPath(path)
+
+
 class ConnectionWidget(QGraphicsItem):
     """Visual representation of a connection between ports"""
+    # Shared by all connections; widens the path so it's easier to click/hover
+    _STROKER = QPainterPathStroker()
+    _STROKER.setWidth(12)
+
     def __init__(self, source_port, target_port=None):
         super().__init__()
         self.id = str(uuid.uuid4())  # <-- Add this line
@@ -22,76 +117,113 @@ class ConnectionWidget(QGraphicsItem):
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setAcceptHoverEvents(True)  # Enable hover events
         self._hovered = False
+        # Geometry cache, see _geometry()/invalidate_geometry()
+        self._cached_path = None
+        self._cached_bbox = None
+        self._cached_shape = None
+        self._layer = None  # ConnectionsLayerItem painting this connection, if any
         if source_port:
             source_port.connections.append(self)
         if target_port:
             target_port.connections.append(self)
 
-    def boundingRect(self) -> QRectF:
+    def _endpoints(self):
+        """Return (source_pos, target_pos) in scene coordinates, or None if incomplete"""
         if self.source_port and (self.target_port or self.temp_end_point):
             source_pos = self.source_port.scenePos()
             if self.target_port:
                 target_pos = self.target_port.scenePos()
             else:
                 target_pos = self.temp_end_point
-            return QRectF(
-                min(source_pos.x(), target_pos.x()) - 10,
-                min(source_pos.y(), target_pos.y()) - 10,
-                abs(target_pos.x() - source_pos.x()) + 20,
-                abs(target_pos.y() - source_pos.y()) + 20
-            )
-        return QRectF()
+            return source_pos, target_pos
+        return None
+
+    def _geometry(self):
+        """Return the cached (path, bounding rect); rebuilt only after invalidate_geometry()"""
+        if self._cached_path is None:
+            endpoints = self._endpoints()
+            if endpoints is None:
+                return None, QRectF()
+            source_pos, target_pos = endpoints
+            sx, sy, tx, ty = source_pos.x(), source_pos.y(), target_pos.x(), target_pos.y()
+            dx = tx - sx
+            self._build_path(sx, sy, tx, ty, sx + dx * 0.5, tx - dx * 0.5)
+        return self._cached_path, self._cached_bbox
+
+    def _build_path(self, sx, sy, tx, ty, ctrl1_x, ctrl2_x):
+        """Cache the bezier path and bounds from endpoints and control-point x coordinates"""
+        path = QPainterPath()
+        path.moveTo(sx, sy)
+        path.cubicTo(ctrl1_x, sy, ctrl2_x, ty, tx, ty)
+        self._cached_path = path
+        self._cached_bbox = QRectF(
+            min(sx, tx) - 10,
+            min(sy, ty) - 10,
+            abs(tx - sx) + 20,
+            abs(ty - sy) + 20
+        )
+
+    def invalidate_geometry(self):
+        """Drop cached geometry after an endpoint moved"""
+        self.prepareGeometryChange()
+        self._cached_path = None
+        self._cached_bbox = None
+        self._cached_shape = None
+        if self._layer is not None:
+            self._layer.refresh()
+
+    def repaint(self):
+        """Schedule a repaint of this connection (through the scene layer when present)"""
+        if self._layer is not None:
+            self._layer.update()
+        else:
+            self.update()
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemSceneChange and self._layer is not None:
+            self._layer.remove_connection(self)
+            self._layer = None
+        elif change == QGraphicsItem.ItemSceneHasChanged and value is not None:
+            layer = getattr(value, 'connections_layer', None)
+            if layer is not None:
+                self._layer = layer
+                layer.add_connection(self)
+        elif change == QGraphicsItem.ItemSelectedHasChanged:
+            self.repaint()
+        return super().itemChange(change, value)
+
+    def boundingRect(self) -> QRectF:
+        return self._geometry()[1]
 
     def hoverEnterEvent(self, event):
         self._hovered = True
-        self.update()
+        self.repaint()
         # Do not call super().hoverEnterEvent(event) to avoid clearing hover state
 
     def hoverLeaveEvent(self, event):
         self._hovered = False
-        self.update()
+        self.repaint()
         # Do not call super().hoverLeaveEvent(event) to avoid clearing hover state
 
     def shape(self):
         # Return a thicker path for easier selection/hover
-        if self.source_port and (self.target_port or self.temp_end_point):
-            from PySide6.QtGui import QPainterPathStroker
-            source_pos = self.source_port.scenePos()
-            if self.target_port:
-                target_pos = self.target_port.scenePos()
-            else:
-                target_pos = self.temp_end_point
-            path = QPainterPath()
-            path.moveTo(source_pos)
-            dx = target_pos.x() - source_pos.x()
-            control1 = QPointF(source_pos.x() + dx * 0.5, source_pos.y())
-            control2 = QPointF(target_pos.x() - dx * 0.5, target_pos.y())
-            path.cubicTo(control1, control2, target_pos)
-            stroker = QPainterPathStroker()
-            stroker.setWidth(12)  # Make the clickable/hoverable area wider
-            return stroker.createStroke(path)
-        return super().shape()
+        path = self._geometry()[0]
+        if path is None:
+            return super().shape()
+        if self._cached_shape is None:
+            self._cached_shape = ConnectionWidget._STROKER.createStroke(path)
+        return self._cached_shape
 
     def paint(self, painter: QPainter, option, widget):
-        if self.source_port and (self.target_port or self.temp_end_point):
-            source_pos = self.source_port.scenePos()
-            if self.target_port:
-                target_pos = self.target_port.scenePos()
-            else:
-                target_pos = self.temp_end_point
-            path = QPainterPath()
-            path.moveTo(source_pos)
-            dx = target_pos.x() - source_pos.x()
-            control1 = QPointF(source_pos.x() + dx * 0.5, source_pos.y())
-            control2 = QPointF(target_pos.x() - dx * 0.5, target_pos.y())
-            path.cubicTo(control1, control2, target_pos)
-            # Highlight on hover or selection
+        path = self._geometry()[0]
+        if path is not None:
+            # Highlight on hover or selection (only used without a ConnectionsLayerItem)
             if self.isSelected():
-                pen = QPen(QColor(255, 255, 100), 4)
+                pen = _PEN_SELECTED
             elif self._hovered:
-                pen = QPen(QColor(100, 255, 255), 4, Qt.DashLine)
+                pen = _PEN_HOVERED
             else:
-                pen = QPen(QColor(200, 200, 200), 2)
+                pen = _PEN_NORMAL
             painter.setPen(pen)
             painter.drawPath(path)
 
@@ -126,14 +258,16 @@ class ConnectionWidget(QGraphicsItem):
         super().mouseReleaseEvent(event)  # Let base class handle selection/hover
 
     def set_temp_end_point(self, point: QPointF):
+        self.invalidate_geometry()
         self.temp_end_point = point
-        self.update()
+        self.repaint()
 
     def complete_connection(self, target_port):
+        self.invalidate_geometry()
         self.target_port = target_port
         target_port.connections.append(self)
         self.temp_end_point = None
-        self.update()
+        self.repaint()
 
     def get_connection_id(self) -> Optional[str]:
         if not self.source_port or not self.target_port:
@@ -39,5 +39,6 @@ class NodePort(QGraphicsEllipseItem):
         super().mousePressEvent(event)
 
     def update_position(self):
-        # Stub for compatibility; implement logic if needed
-        pass
+        # The owning node moved: attached connections must rebuild their cached geometry
+        for connection in self.connections:
+            connection.invalidate_geometry()
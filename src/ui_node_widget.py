@@ -1,31 +1,221 @@
-from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsTextItem, QGraphicsProxyWidget, QLineEdit, QGraphicsItem, QGraphicsWidget, QPushButton
-from PySide6.QtGui import QBrush, QColor, QPen, QFont, QPainter
-from PySide6.QtCore import Qt, QObject, QRectF
+from PySide6.QtWidgets import QApplication, QGraphicsRectItem, QGraphicsProxyWidget, QLineEdit, QGraphicsItem, QGraphicsWidget, QPushButton
+from PySide6.QtGui import QBrush, QColor, QPen, QFont, QPainter, QPainterPath
+from PySide6.QtCore import Qt, QRectF, QTimer, Slot
+from contextlib import contextmanager
+from functools import partial
 from typing import Dict
+import logging
+import weakref
 from .ui_node_port import NodePort
 from .ui_connection_widget import ConnectionWidget
 
+logger = logging.getLogger(__name__)
+
+# Shared styling; built once instead of on every paint/refresh
+_LABEL_FONT = QFont("Arial", 8)
+_TITLE_FONT = QFont("Arial", 10)
+_TITLE_FONT.setBold(True)
+# Pens/brushes rather than bare colours, so painter.setPen/setBrush don't convert on every paint
+_PORT_LABEL_PEN = QPen(QColor(200, 200, 200))
+_LABEL_PEN = QPen(QColor(220, 220, 220))
+_VALUE_PEN = QPen(QColor(255, 255, 180))
+_HEADER_BRUSH = QBrush(QColor(40, 40, 40))
+_TITLE_PEN = QPen(QColor(220, 40, 40))
+_TITLE_FLAGS = Qt.AlignVCenter | Qt.AlignLeft
+_PROP_LABEL_FLAGS = Qt.AlignLeft | Qt.AlignTop | Qt.TextDontClip
+_PROP_VALUE_FLAGS = Qt.AlignLeft | Qt.AlignTop
+_IN_PORT_FLAGS = Qt.AlignLeft | Qt.AlignVCenter
+_OUT_PORT_FLAGS = Qt.AlignRight | Qt.AlignVCenter
+_BODY_BRUSH = QBrush(QColor(80, 80, 80))
+_DEFAULT_PEN = QPen(QColor(200, 200, 200), 2)
+_HOVER_PEN = QPen(QColor(100, 255, 255), 4, Qt.DashLine)
+# Half the widest (hover) pen plus a pixel of antialiasing; the border is stroked this far outside the card
+_PEN_MARGIN = 3
+
+# While paused, data_changed only marks cards dirty; resume_refresh() redraws each one once
+_refresh_paused = False
+_deferred_refresh = set()
+
+
+def pause_refresh():
+    """Stop NodeWidgets from redrawing on data_changed, e.g. around bulk graph loads"""
+    global _refresh_paused
+    _refresh_paused = True
+
+
+def resume_refresh():
+    """Redraw every NodeWidget whose node changed while refreshes were paused"""
+    global _refresh_paused
+    _refresh_paused = False
+    widgets = list(_deferred_refresh)
+    _deferred_refresh.clear()
+    for widget in widgets:
+        try:
+            widget.refresh()
+        except RuntimeError:
+            pass  # deleted by the scene in the meantime
+
+def _port_values(ports):
+    """Values of port/input objects by name"""
+    return {name: getattr(port, 'value', getattr(port, 'default_value', ''))
+            for name, port in tuple(ports.items())}
+
+
+def _property_values(properties):
+    """Values of a properties mapping whose entries are dicts or value objects"""
+    values = {}
+    for prop_name, prop in tuple(properties.items()):
+        if isinstance(prop, dict):
+            values[prop_name] = prop.get('value', prop.get('default_value', ''))
+        else:
+            values[prop_name] = getattr(prop, 'value', getattr(prop, 'default_value', str(prop)))
+    return values
+
+
+def _input_name_values(node):
+    """Values for each of node.input_names, from whichever source holds them"""
+    input_ports = getattr(node, 'input_ports', None)
+    inputs = getattr(node, 'inputs', None)
+    values = {}
+    for port_name in node.input_names:
+        value = ''
+        # Try to get value from input_ports if it exists
+        if input_ports and port_name in input_ports:
+            port = input_ports[port_name]
+            value = getattr(port, 'value', getattr(port, 'default_value', ''))
+        # Try to get value from inputs
+        elif inputs and port_name in inputs:
+            prop = inputs[port_name]
+            value = getattr(prop, 'value', getattr(prop, 'default_value', ''))
+        # Try direct attribute access
+        elif hasattr(node, port_name):
+            attr_value = getattr(node, port_name)
+            if not callable(attr_value):
+                value = str(attr_value)
+        values[port_name] = value
+    return values
+
+
+def _attribute_values(node):
+    """Fallback: any public non-callable attributes that look like properties"""
+    values = {}
+    for attr_name in dir(node):
+        if not attr_name.startswith('_') and attr_name not in ['name', 'position', 'input_ports', 'output_ports']:
+            attr_value = getattr(node, attr_name)
+            if not callable(attr_value):
+                values[attr_name] = str(attr_value)
+    return values
+
+
+# Where a node's properties live, probed in this order; (attribute, reader of that attribute)
+_PROPERTY_SOURCES = (
+    ('input_ports', _port_values),
+    ('inputs', _port_values),
+    ('properties', _property_values),
+)
+
+
+def _read_source(node, source, reader):
+    return reader(getattr(node, source, None) or {})
+
+
+def _resolve_props_source(node, editable=False):
+    """Decide once how to read a node's properties; returns a callable giving {name: value}"""
+    if not editable and getattr(node, 'input_names', None):
+        return partial(_input_name_values, node)
+    for source, reader in _PROPERTY_SOURCES:
+        if getattr(node, source, None):
+            return partial(_read_source, node, source, reader)
+    if editable:
+        return dict  # nothing editable
+    return partial(_attribute_values, node)
+
+
+class _NodeEditor(QLineEdit):
+    """Property editor that ends its card's editing on focus loss or Escape, without an event filter"""
+    def __init__(self, text, node_widget, prop_name):
+        super().__init__(text)
+        self._node_widget = weakref.ref(node_widget)
+        self.prop_name = prop_name
+        self.editingFinished.connect(self._on_editing_finished)
+
+    @Slot()
+    def _on_editing_finished(self):
+        """Commit this editor's text to the card (a declared slot, not a dynamic one)"""
+        node_widget = self._node_widget()
+        if node_widget is not None:
+            node_widget.update_property_with_proxy(self.graphicsProxyWidget(), self.prop_name)
+
+    def focusOutEvent(self, event):
+        super().focusOutEvent(event)  # emits editingFinished, which commits the value
+        node_widget = self._node_widget()
+        if node_widget is not None and not node_widget._focus_moved_within_card(self):
+            node_widget.finish_editing()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self._cancel()
+            return
+        super().keyPressEvent(event)
+
+    def _cancel(self):
+        """Leave editing without committing this editor's text"""
+        self.blockSignals(True)
+        node_widget = self._node_widget()
+        if node_widget is not None:
+            node_widget.finish_editing()
+
+
 class NodeWidget(QGraphicsRectItem):
     """Visual representation of a process node"""
+    # Immutable defaults live on the class, so a card only grows its own __dict__ entry once a
+    # value diverges (__slots__ wouldn't help: the PySide wrapper keeps an instance dict anyway)
+    node_width = 150
+    header_height = 28
+    editing = False
+    _default_pen = _DEFAULT_PEN
+    _hover_pen = _HOVER_PEN
+    _data_connected = False  # see _connect_data_changed
+    _needs_refresh = False  # data changed while hidden
+    _ports_dicts = None  # lazily built input/output port dicts
+    _last_pos = None  # position connections were last invalidated for
+    _port_update_timer = None  # created on first move; see _flush_port_updates
+    _commit_timer = None  # created on first edit; batches editor commits
+    _prop_names = ()  # property names in the order of the "props" rows
+    # Row y-offsets, precomputed by _compute_layout() instead of y_offset + i * step per row
+    _port_y = ()
+    _prop_y = ()
+    _last_prop_count = None  # property count the card was last sized for
+    _last_props_key = None  # (name, text) pairs last shown by show_properties_on_card
+    _resize_pending = False
+    _refresh_scheduled = False
+    _is_empty_node = False  # no input ports, inputs or properties, so nothing to show or edit; see _check_empty()
+
     def __init__(self, process_node, parent=None):
         super().__init__(parent)
         self.process_node = process_node
         
         # Connect process_node's data_changed signal to update_node if it exists
-        if hasattr(self.process_node, 'data_changed'):
-            self.process_node.data_changed.connect(self.update_node)
+        # (disconnected while the card is hidden, see itemChange)
+        self._connect_data_changed(True)
             
-        self.input_ports: Dict[str, NodePort] = {}
-        self.output_ports: Dict[str, NodePort] = {}
-        
-        # Set initial size - this is crucial!
-        self.node_width = 150
+        # Port widgets as parallel name/widget lists plus a name -> index map;
+        # the input_ports/output_ports dicts are only built if someone asks for them
+        self._input_names = []
+        self._input_port_widgets = []
+        self._input_index = {}
+        self._output_names = []
+        self._output_port_widgets = []
+        self._output_index = {}
+        
+        # Set initial size - this is crucial! (node_width/header_height are class defaults)
         self.node_height = 100
+        self._rebuild_geometry_cache()
         self.setRect(0, 0, self.node_width, self.node_height)
         
         # Set appearance
-        self.setBrush(QBrush(QColor(80, 80, 80)))
-        self.setPen(QPen(QColor(200, 200, 200), 2))
+        self.setBrush(_BODY_BRUSH)
+        self.setPen(_DEFAULT_PEN)
         
         # Set flags for interaction
         self.setFlags(
@@ -34,26 +224,20 @@ class NodeWidget(QGraphicsRectItem):
             QGraphicsRectItem.ItemSendsGeometryChanges
         )
         self.setAcceptHoverEvents(True)
+        # Blit the painted card from a pixmap cache while it's dragged instead of repainting it
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        # Get a real option.exposedRect in paint() so rows outside it can be skipped
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
         
-        # Hover effects
-        self._default_pen = QPen(QColor(200, 200, 200), 2)
-        self._hover_pen = QPen(QColor(100, 255, 255), 4, Qt.DashLine)
-        self.setPen(self._default_pen)
-        
-        # Remove old QGraphicsTextItem title
-        # self.title = QGraphicsTextItem(process_node.name, self)
-        # self.title.setPos(10, 5)
-        # self.title.setDefaultTextColor(QColor(255, 255, 255))
-        # font = QFont()
-        # font.setBold(True)
-        # self.title.setFont(font)
-
-        # Header height
-        self.header_height = 28
-
         # Initialize properties
-        self.properties_labels = {}
-        self.editing = False
+        self.properties_labels = {}  # property name -> editor proxy while editing
+        self.edit_proxies = {}  # property name -> _NodeEditor while editing
+        self._edit_pool = {}  # property name -> (proxy, editor), hidden between edit sessions
+        # Text drawn directly in paint() instead of one QGraphicsTextItem child per label:
+        # "ports" holds (top, bottom, rect, flags, text),
+        # "props" holds (top, bottom, label_rect, label, value_rect, value)
+        self._layout_cache = {"ports": (), "props": ()}
+        self._pending_updates = {}  # property name -> edited text awaiting _flush_pending_updates
         
         # Create ports and setup UI
         self.create_ports()
@@ -63,113 +247,307 @@ class NodeWidget(QGraphicsRectItem):
         if hasattr(process_node, 'position'):
             self.setPos(process_node.position[0], process_node.position[1])
 
+    def _rebuild_geometry_cache(self):
+        """Recompute the rects and title paint() uses; only needed on resize or rename"""
+        self._update_bounds()
+        self._header_rect = QRectF(0, 0, self.node_width, self.header_height)
+        self._title_rect = self._header_rect.adjusted(10, 0, -10, 0)
+        self._body_rect = QRectF(0, self.header_height, self.node_width, self.node_height - self.header_height)
+        self._update_title()
+
+    def _update_title(self):
+        """Cache the header text; returns True if it changed"""
+        node = self.process_node
+        title = getattr(node, "name", "Node")
+        node_id = getattr(node, "node_id", None)
+        if node_id is None:
+            node_id = node.id.split("-")[0]
+        title_text = f"{title} [{node_id}]"
+        if title_text == getattr(self, '_title_text_cached', None):
+            return False
+        self._title_text_cached = title_text
+        return True
+
+    def _update_bounds(self):
+        """Recompute the cached bounding rect/shape from node_width and node_height"""
+        m = _PEN_MARGIN
+        if getattr(self, '_bounding_rect', None) is None:
+            self._card_rect = QRectF(0, 0, self.node_width, self.node_height)
+            self._bounding_rect = QRectF(-m, -m, self.node_width + 2 * m, self.node_height + 2 * m)
+        else:
+            # Resize the cached rects in place rather than allocating new ones per resize
+            self._card_rect.setWidth(self.node_width)
+            self._card_rect.setHeight(self.node_height)
+            self._bounding_rect.setWidth(self.node_width + 2 * m)
+            self._bounding_rect.setHeight(self.node_height + 2 * m)
+        # Hit testing uses the card itself, not the pen margin
+        self._shape = QPainterPath()
+        self._shape.addRect(self._card_rect)
+
+    @property
+    def input_ports(self) -> Dict[str, NodePort]:
+        """Input port widgets by name (built lazily from the port lists)"""
+        return self._port_dicts()[0]
+
+    @property
+    def output_ports(self) -> Dict[str, NodePort]:
+        """Output port widgets by name (built lazily from the port lists)"""
+        return self._port_dicts()[1]
+
+    def _port_dicts(self):
+        if self._ports_dicts is None:
+            self._ports_dicts = (dict(zip(self._input_names, self._input_port_widgets)),
+                                 dict(zip(self._output_names, self._output_port_widgets)))
+        return self._ports_dicts
+
+    def _add_port_widget(self, name, port_widget, is_input):
+        """Record a port widget in the input/output lists"""
+        if is_input:
+            names, widgets, index = self._input_names, self._input_port_widgets, self._input_index
+        else:
+            names, widgets, index = self._output_names, self._output_port_widgets, self._output_index
+        if name in index:
+            widgets[index[name]] = port_widget
+        else:
+            index[name] = len(names)
+            names.append(name)
+            widgets.append(port_widget)
+        self._ports_dicts = None
+
     def boundingRect(self):
         """Return the bounding rectangle of the widget"""
-        return QRectF(0, 0, self.node_width, self.node_height)
+        return self._bounding_rect
+
+    def shape(self):
+        """Return the (cached) outline used for hit testing"""
+        return self._shape
+
+    @contextmanager
+    def _batch_update(self):
+        """Build many child items with scene signals and geometry notifications paused, then repaint once"""
+        scene = self.scene()
+        was_blocked = scene.blockSignals(True) if scene else False
+        sends_geometry = bool(self.flags() & QGraphicsItem.ItemSendsGeometryChanges)
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, False)
+        try:
+            yield
+        finally:
+            self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, sends_geometry)
+            if scene:
+                scene.blockSignals(was_blocked)
+            self.update()
 
     def paint(self, painter, option, widget):
         """Paint the node widget with a header/titlebar"""
-        # Draw header/titlebar
-        header_rect = QRectF(0, 0, self.node_width, self.header_height)
-        painter.save()
-        painter.setBrush(QColor(40, 40, 40))  # dark gray
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(header_rect)
-
-        # Draw title in red
-        title = getattr(self.process_node, "name", "Node")
-        node_id = getattr(self.process_node, "node_id", self.process_node.id.split('-')[0])
-        title_text = f"{title} [{node_id}]"
-        font = QFont("Arial", 10)
-        font.setBold(True)
-        painter.setFont(font)
-        painter.setPen(QColor(220, 40, 40))  # red
-        painter.drawText(header_rect.adjusted(10, 0, -10, 0), Qt.AlignVCenter | Qt.AlignLeft, title_text)
-        painter.restore()
-
-        # Draw the rest of the node (body)
-        body_rect = QRectF(0, self.header_height, self.node_width, self.node_height - self.header_height)
-        painter.save()
-        painter.setBrush(self.brush())
-        painter.setPen(self.pen())
-        painter.drawRect(body_rect)
-        painter.restore()
-
-        # Draw border around the whole node
-        painter.save()
-        painter.setPen(self.pen())
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRect(QRectF(0, 0, self.node_width, self.node_height))
-        painter.restore()
+        # No save()/restore() pairs: each region sets the pen/brush it needs, and the
+        # view already saves the painter state around every item's paint()
+        # Only draw the regions the exposed rect touches, e.g. just the header while scrolling
+        exposed = option.exposedRect
+        
+        # Draw header/titlebar (rects and title are cached by _rebuild_geometry_cache)
+        if exposed.intersects(self._header_rect):
+            painter.setBrush(_HEADER_BRUSH)  # dark gray
+            painter.setPen(Qt.NoPen)
+            painter.drawRect(self._header_rect)
+
+            # Draw title in red
+            painter.setFont(_TITLE_FONT)
+            painter.setPen(_TITLE_PEN)  # red
+            painter.drawText(self._title_rect, _TITLE_FLAGS, self._title_text_cached)
+
+        # Draw the rest of the node (body); its outline reaches half a pen width past the rect
+        pen = self.pen()
+        margin = pen.widthF()
+        if exposed.intersects(self._body_rect.adjusted(-margin, -margin, margin, margin)):
+            painter.setBrush(self.brush())
+            painter.setPen(pen)
+            painter.drawRect(self._body_rect)
+
+        # Draw border around the whole node, unless only its interior is exposed
+        if not self._card_rect.adjusted(margin, margin, -margin, -margin).contains(exposed):
+            painter.setPen(pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(self._card_rect)
+
+        # Draw port and property labels, skipping rows outside the exposed area
+        top, bottom = exposed.top(), exposed.bottom()
+        painter.setFont(_LABEL_FONT)
+        painter.setPen(_PORT_LABEL_PEN)
+        for y0, y1, rect, flags, text in self._layout_cache["ports"]:
+            if y1 >= top and y0 <= bottom:
+                painter.drawText(rect, flags, text)
+        props = [row for row in self._layout_cache["props"] if row[1] >= top and row[0] <= bottom]
+        if props:
+            painter.setPen(_LABEL_PEN)
+            for _, _, label_rect, label, _, _ in props:
+                painter.drawText(label_rect, _PROP_LABEL_FLAGS, label)
+            if not self.editing:  # editors cover the values while editing
+                painter.setPen(_VALUE_PEN)
+                for _, _, _, _, value_rect, value in props:
+                    painter.drawText(value_rect, _PROP_VALUE_FLAGS, value)
+
+    def _compute_layout(self, n_ports, n_props):
+        """Precompute the y-offsets of port rows and property rows below the header"""
+        port_top = self.header_height + 2  # move ports below header
+        prop_top = self.header_height + 25  # move properties/editors below header
+        self._port_y = tuple(port_top + i * 20 for i in range(n_ports))
+        self._prop_y = tuple(prop_top + i * 22 for i in range(n_props))
+
+    def _prop_offsets(self, n_props):
+        """Property row y-offsets, covering at least ``n_props`` rows"""
+        if len(self._prop_y) < n_props:
+            self._compute_layout(len(self._port_y), n_props)
+        return self._prop_y
+
+    def _prop_row(self, y, prop_name, value_text=""):
+        """Layout entry for one property row starting at ``y``"""
+        return (y, y + 22, QRectF(14, y + 4, 56, 14), f"{prop_name}: ",
+                QRectF(74, y + 4, self.node_width - 78, 14), value_text)
+
+    def _check_empty(self):
+        """Cache whether the node has nothing to show or edit: no input names and no property source"""
+        self._is_empty_node = (self._editable_source is dict
+                               and not getattr(self.process_node, 'input_names', None))
+
+    def _resolve_sources(self):
+        """Pick the property readers for the current process node (see _resolve_props_source)"""
+        self._props_source = _resolve_props_source(self.process_node)
+        self._editable_source = _resolve_props_source(self.process_node, editable=True)
 
     def create_ports(self):
         """Create input and output ports"""
-        y_offset = self.header_height + 2  # move ports below header
+        self._resolve_sources()
+        self._check_empty()
+        node = self.process_node
+        node_input_ports = getattr(node, 'input_ports', None) or {}
         
         # Get input ports using input_names property
-        input_names = getattr(self.process_node, 'input_names', [])
+        input_names = getattr(node, 'input_names', [])
         input_ports = {}
         
         # Build input_ports dict from input_names
         if input_names:
             for name in input_names:
                 # Try to get the actual port object if it exists
-                if hasattr(self.process_node, 'input_ports') and name in self.process_node.input_ports:
-                    input_ports[name] = self.process_node.input_ports[name]
+                if name in node_input_ports:
+                    input_ports[name] = node_input_ports[name]
                 else:
                     # Create a placeholder port object if needed
                     input_ports[name] = type('Port', (), {'name': name, 'value': '', 'default_value': ''})()
         else:
             # Fallback to existing input_ports if input_names not available
-            input_ports = getattr(self.process_node, 'input_ports', {})
+            input_ports = node_input_ports
         
         # Get output ports
-        output_ports = getattr(self.process_node, 'output_ports', {})
+        output_ports = getattr(node, 'output_ports', {})
         
         if not input_ports and not output_ports:
-            print(f"Warning: Node {getattr(self.process_node, 'name', 'Unknown')} has no ports or properties")
+            logger.warning("Node %s has no ports or properties", getattr(node, 'name', 'Unknown'))
             return
             
-        # Create input ports
-        for i, (name, port) in enumerate(input_ports.items()):
-            port_widget = NodePort(name, True, self, self)
-            port_widget.setPos(-6, y_offset + i * 20)
-            self.input_ports[name] = port_widget
-
-            # Create label for input port
-            label = QGraphicsTextItem(name, self)
-            label.setPos(15, y_offset + i * 20 - 8)
-            label.setDefaultTextColor(QColor(200, 200, 200))
-            label.setFont(QFont("Arial", 8))
-
-        # Create output ports
-        for i, (name, port) in enumerate(output_ports.items()):
-            port_widget = NodePort(name, False, self, self)
-            port_widget.setPos(self.node_width + 6, y_offset + i * 20)
-            self.output_ports[name] = port_widget
-
-            # Create label for output port
-            label = QGraphicsTextItem(name, self)
-            label.setPos(self.node_width - 35, y_offset + i * 20 - 8)
-            label.setDefaultTextColor(QColor(200, 200, 200))
-            label.setFont(QFont("Arial", 8))
+        self._compute_layout(max(len(input_ports), len(output_ports)), len(input_ports))
+        port_y = self._port_y
+        port_labels = []
+        half_width = self.node_width / 2
+        with self._batch_update():
+            # Create input ports
+            for i, (name, port) in enumerate(input_ports.items()):
+                port_widget = NodePort(name, True, self, self)
+                port_widget.setPos(-6, port_y[i])
+                self._add_port_widget(name, port_widget, True)
+
+                # Label for input port, painted left-aligned next to it
+                y = port_y[i] - 10
+                port_labels.append((y, y + 20, QRectF(15, y, half_width - 15, 20),
+                                    _IN_PORT_FLAGS, name))
+
+            # Create output ports
+            for i, (name, port) in enumerate(output_ports.items()):
+                port_widget = NodePort(name, False, self, self)
+                port_widget.setPos(self.node_width + 6, port_y[i])
+                self._add_port_widget(name, port_widget, False)
+
+                # Label for output port, painted right-aligned next to it
+                y = port_y[i] - 10
+                port_labels.append((y, y + 20, QRectF(half_width, y, half_width - 8, 20),
+                                    _OUT_PORT_FLAGS, name))
+        self._layout_cache["ports"] = tuple(port_labels)
+
+    def _connect_data_changed(self, connect):
+        """Attach/detach update_node from the process node's data_changed signal"""
+        signal = getattr(self.process_node, 'data_changed', None)
+        if signal is None or connect == self._data_connected:
+            return
+        if connect:
+            signal.connect(self.update_node)
+        else:
+            signal.disconnect(self.update_node)
+        self._data_connected = connect
+
+    def set_process_node(self, process_node):
+        """Point the card at another process node, moving the data_changed hookup with it"""
+        self._connect_data_changed(False)
+        self.process_node = process_node
+        self._drop_edit_pool()
+        self._resolve_sources()
+        self._check_empty()
+        self._last_props_key = None
+        self._update_title()
+        self._connect_data_changed(self.isVisible())
+        self.refresh()
+
+    def _drop_edit_pool(self):
+        """Destroy the pooled editors, e.g. when the card's properties no longer apply"""
+        self.finish_editing()
+        for proxy, _ in self._edit_pool.values():
+            proxy.setWidget(None)
+            proxy.setParentItem(None)
+        self._edit_pool = {}
 
     def itemChange(self, change, value):
         """Handle item changes"""
-        if change == QGraphicsItem.ItemPositionHasChanged:
+        if change == QGraphicsItem.ItemVisibleHasChanged:
+            if value:
+                self._connect_data_changed(True)
+                if self._needs_refresh:
+                    self._needs_refresh = False
+                    self._update_title()  # a rename while hidden never reached update_node
+                    self.refresh()
+            else:
+                # Hidden cards don't follow data changes; catch up once when shown again
+                self._connect_data_changed(False)
+                self._needs_refresh = True
+        elif change == QGraphicsItem.ItemPositionHasChanged:
+            new_pos = (self.x(), self.y())
+            if new_pos == self._last_pos:
+                return super().itemChange(change, value)  # e.g. setPos() to the same spot
+            self._last_pos = new_pos
+            
             # Update process node position
             if hasattr(self.process_node, 'position'):
-                self.process_node.position = (self.x(), self.y())
+                self.process_node.position = new_pos
             
-            # Update port positions
-            for port in self.input_ports.values():
-                if hasattr(port, 'update_position'):
-                    port.update_position()
-            for port in self.output_ports.values():
-                if hasattr(port, 'update_position'):
-                    port.update_position()
+            # Re-path connections once per event-loop pass, however many move events a drag delivers.
+            # The ports themselves are children, so Qt translates them with the card for free.
+            if self._port_update_timer is None:
+                self._port_update_timer = QTimer()
+                self._port_update_timer.setSingleShot(True)
+                self._port_update_timer.setInterval(0)
+                self._port_update_timer.timeout.connect(self._flush_port_updates)
+            if not self._port_update_timer.isActive():
+                self._port_update_timer.start()
         return super().itemChange(change, value)
 
+    def _flush_port_updates(self):
+        """Invalidate each attached connection once, even if it links two of this card's ports"""
+        connections = set()
+        for port in self._input_port_widgets:
+            connections.update(port.connections)
+        for port in self._output_port_widgets:
+            connections.update(port.connections)
+        for connection in connections:
+            connection.invalidate_geometry()
+
     def mousePressEvent(self, event):
         """Handle mouse press events"""
         if event.button() == Qt.RightButton:
@@ -187,148 +565,92 @@ class NodeWidget(QGraphicsRectItem):
 
     def show_properties_on_card(self):
         """Display node properties on the card"""
-        # Remove old property labels
-        for label in getattr(self, 'properties_labels', {}).values():
-            if isinstance(label, tuple):
-                for item in label:
-                    if isinstance(item, (QGraphicsTextItem, QGraphicsProxyWidget)):
-                        if hasattr(item, 'setParentItem'):
-                            item.setParentItem(None)
-            elif isinstance(label, (QGraphicsTextItem, QGraphicsProxyWidget)):
-                if hasattr(label, 'setParentItem'):
-                    label.setParentItem(None)
-        self.properties_labels = {}
-        
-        y_offset = self.header_height + 25  # move properties below header
-        
-        # Get properties to display using input_names
-        properties_to_show = {}
+        if self._is_empty_node:
+            # Nothing to list: drop stale rows and keep the minimum height, no loops or resizes
+            self.properties_labels = {}
+            if self._layout_cache["props"]:
+                self._layout_cache["props"] = ()
+                self._prop_names = ()
+                self.update()
+            if self._last_prop_count != 0:
+                self._last_prop_count = 0
+                self.adjust_card_size_for_properties()
+            return
         
-        # Try input_names first
-        input_names = getattr(self.process_node, 'input_names', [])
-        if input_names:
-            for port_name in input_names:
-                value = ''
-                # Try to get value from input_ports if it exists
-                if hasattr(self.process_node, 'input_ports') and port_name in self.process_node.input_ports:
-                    port = self.process_node.input_ports[port_name]
-                    value = getattr(port, 'value', getattr(port, 'default_value', ''))
-                # Try to get value from inputs
-                elif hasattr(self.process_node, 'inputs') and port_name in self.process_node.inputs:
-                    prop = self.process_node.inputs[port_name]
-                    value = getattr(prop, 'value', getattr(prop, 'default_value', ''))
-                # Try direct attribute access
-                elif hasattr(self.process_node, port_name):
-                    attr_value = getattr(self.process_node, port_name)
-                    if not callable(attr_value):
-                        value = str(attr_value)
-                
-                properties_to_show[port_name] = value
-        # Fallback to existing logic if input_names not available
-        elif hasattr(self.process_node, 'input_ports') and self.process_node.input_ports:
-            for port_name, port in self.process_node.input_ports.items():
-                value = getattr(port, 'value', getattr(port, 'default_value', ''))
-                properties_to_show[port_name] = value
-        # Try inputs
-        elif hasattr(self.process_node, 'inputs') and self.process_node.inputs:
-            for prop_name, prop in self.process_node.inputs.items():
-                value = getattr(prop, 'value', getattr(prop, 'default_value', ''))
-                properties_to_show[prop_name] = value
-        # Try properties directly
-        elif hasattr(self.process_node, 'properties') and self.process_node.properties:
-            for prop_name, prop in self.process_node.properties.items():
-                if isinstance(prop, dict):
-                    value = prop.get('value', prop.get('default_value', ''))
-                else:
-                    value = getattr(prop, 'value', getattr(prop, 'default_value', str(prop)))
-                properties_to_show[prop_name] = value
-        # Fallback: try to get any attributes that look like properties
+        properties_to_show = self._props_source()
+        # (name, shown text) pairs; compared as strings since values may be arrays
+        shown = tuple((name, str(value)) for name, value in properties_to_show.items())
+        if shown == self._last_props_key:
+            return  # redundant data_changed: nothing on the card would change
+        self._last_props_key = shown
+        
+        # Display properties; repaint only when a row's text actually changed
+        names = tuple(properties_to_show)
+        rows = self._layout_cache["props"]
+        if names == self._prop_names and len(rows) == len(names):
+            # Same rows as before: swap in just the changed values and repaint just those cells
+            new_rows = None
+            for i, (_, value) in enumerate(shown):
+                if rows[i][5] != value:
+                    if new_rows is None:
+                        new_rows = list(rows)
+                    new_rows[i] = rows[i][:5] + (value,)
+                    self.update(rows[i][4])
+            if new_rows is not None:
+                self._layout_cache["props"] = tuple(new_rows)
         else:
-            for attr_name in dir(self.process_node):
-                if not attr_name.startswith('_') and attr_name not in ['name', 'position', 'input_ports', 'output_ports']:
-                    attr_value = getattr(self.process_node, attr_name)
-                    if not callable(attr_value):
-                        properties_to_show[attr_name] = str(attr_value)
-        
-        # Display properties
-        for i, (prop_name, value) in enumerate(properties_to_show.items()):
-            # Property name label
-            label = QGraphicsTextItem(f"{prop_name}: ", self)
-            label.setPos(10, y_offset + i * 22)
-            label.setDefaultTextColor(QColor(220, 220, 220))
-            label.setFont(QFont("Arial", 8))
-            
-            # Property value label
-            value_text = str(value)
-            value_label = QGraphicsTextItem(value_text, self)
-            value_label.setPos(70, y_offset + i * 22)
-            value_label.setDefaultTextColor(QColor(255, 255, 180))
-            value_label.setFont(QFont("Arial", 8))
-            
-            self.properties_labels[prop_name] = (label, value_label)
-        
-        self.adjust_card_size_for_properties()
+            prop_y = self._prop_offsets(len(names))
+            self._layout_cache["props"] = tuple(self._prop_row(prop_y[i], prop_name, value)
+                                                for i, (prop_name, value) in enumerate(shown))
+            self._prop_names = names
+            self.update()
+        
+        if len(properties_to_show) != self._last_prop_count:
+            self._last_prop_count = len(properties_to_show)
+            self.adjust_card_size_for_properties()
 
     def start_editing(self):
         """Start editing mode for properties"""
-        if self.editing:
+        if self.editing or self._is_empty_node:
             return
         self.editing = True
-        
-        # Remove old property labels
-        for label_pair in self.properties_labels.values():
-            if isinstance(label_pair, tuple):
-                for label in label_pair:
-                    if hasattr(label, 'setParentItem'):
-                        label.setParentItem(None)
-            else:
-                if hasattr(label_pair, 'setParentItem'):
-                    label_pair.setParentItem(None)
+        self._last_props_key = None  # editing blanks the painted values; redraw them afterwards
         
         self.properties_labels = {}
         self.edit_proxies = {}
-        y_offset = self.header_height + 25  # move editors below header
         
         # Get editable properties
-        editable_properties = {}
-        
-        if hasattr(self.process_node, 'input_ports') and self.process_node.input_ports:
-            for port_name, port in self.process_node.input_ports.items():
-                value = getattr(port, 'value', getattr(port, 'default_value', ''))
-                editable_properties[port_name] = value
-        elif hasattr(self.process_node, 'inputs') and self.process_node.inputs:
-            for prop_name, prop in self.process_node.inputs.items():
-                value = getattr(prop, 'value', getattr(prop, 'default_value', ''))
-                editable_properties[prop_name] = value
-        elif hasattr(self.process_node, 'properties') and self.process_node.properties:
-            for prop_name, prop in self.process_node.properties.items():
-                if isinstance(prop, dict):
-                    value = prop.get('value', prop.get('default_value', ''))
+        editable_properties = self._editable_source()
+        
+        # Property name labels are painted; only the value editors are real items.
+        # Rows already laid out for the same names are kept as they are (paint() skips
+        # values while editing), so an edit session doesn't rebuild the layout.
+        prop_y = self._prop_offsets(len(editable_properties))
+        names = tuple(editable_properties)
+        if names != self._prop_names or len(self._layout_cache["props"]) != len(names):
+            self._layout_cache["props"] = tuple(self._prop_row(prop_y[i], prop_name)
+                                                for i, prop_name in enumerate(names))
+            self._prop_names = names
+        
+        with self._batch_update():
+            for i, (prop_name, value) in enumerate(editable_properties.items()):
+                # Property value editor, reused from an earlier session when possible
+                current_value = str(value)
+                pooled = self._edit_pool.get(prop_name)
+                if pooled is None:
+                    editor = _NodeEditor(current_value, self, prop_name)
+                    proxy = QGraphicsProxyWidget(self)
+                    proxy.setWidget(editor)
+                    self._edit_pool[prop_name] = (proxy, editor)
                 else:
-                    value = getattr(prop, 'value', getattr(prop, 'default_value', str(prop)))
-                editable_properties[prop_name] = value
-        
-        for i, (prop_name, value) in enumerate(editable_properties.items()):
-            # Property name label
-            label = QGraphicsTextItem(f"{prop_name}: ", self)
-            label.setPos(10, y_offset + i * 22)
-            label.setDefaultTextColor(QColor(220, 220, 220))
-            label.setFont(QFont("Arial", 8))
-            
-            # Property value editor
-            current_value = str(value)
-            editor = QLineEdit(current_value)
-            proxy = QGraphicsProxyWidget(self)
-            proxy.setWidget(editor)
-            proxy.setPos(70, y_offset + i * 22 - 2)
+                    proxy, editor = pooled
+                    editor.blockSignals(False)  # left blocked if the last session was cancelled
+                    editor.setText(current_value)
+                    proxy.setVisible(True)
+                proxy.setPos(70, prop_y[i] - 2)
             
-            # Connect editor signals
-            editor.editingFinished.connect(
-                lambda prop_name=prop_name, proxy=proxy: self.update_property_with_proxy(proxy, prop_name)
-            )
-            
-            self.properties_labels[prop_name] = (label, proxy)
-            self.edit_proxies[prop_name] = editor
+                self.properties_labels[prop_name] = proxy
+                self.edit_proxies[prop_name] = editor
         
         self.adjust_card_size_for_properties()
 
@@ -337,13 +659,15 @@ class NodeWidget(QGraphicsRectItem):
         if not self.editing:
             return
         
-        # Remove proxy widgets
-        for prop, (label, proxy) in self.properties_labels.items():
-            if isinstance(proxy, QGraphicsProxyWidget):
-                proxy.setWidget(None)
-                proxy.setParentItem(None)
-        
+        # Leave editing first so focus-out from hiding the editors doesn't re-enter here
         self.editing = False
+        
+        # Hide the proxy widgets; they're kept in _edit_pool for the next session
+        for proxy in self.properties_labels.values():
+            proxy.setVisible(False)
+        self.properties_labels = {}
+        
+        self.update()  # values are painted again
         self.show_properties_on_card()
 
     def update_property_with_proxy(self, proxy_widget, property_name):
@@ -353,11 +677,52 @@ class NodeWidget(QGraphicsRectItem):
         
         editor = proxy_widget.widget()
         if editor:
-            self.update_property(property_name, editor.text())
-        self.finish_editing()
+            # Queue the value; edits landing within 50 ms are applied with one data_changed
+            self._pending_updates[property_name] = editor.text()
+            if self._commit_timer is None:
+                self._commit_timer = QTimer()
+                self._commit_timer.setSingleShot(True)
+                self._commit_timer.setInterval(50)
+                self._commit_timer.timeout.connect(self._flush_pending_updates)
+            self._commit_timer.start()
+        # Tabbing/clicking to another editor on this card commits without tearing the editors down
+        if not self._focus_moved_within_card(editor):
+            self.finish_editing()
+
+    def _focus_moved_within_card(self, old_editor=None):
+        """True if focus now sits in one of this card's editors other than old_editor"""
+        if not self.editing:
+            return False
+        focus = QApplication.focusWidget()
+        if focus is not None and focus is not old_editor and focus in self.edit_proxies.values():
+            return True
+        scene = self.scene()
+        item = scene.focusItem() if scene is not None else None
+        return (item is not None and item.parentItem() is self
+                and item in self.properties_labels.values() and item.widget() is not old_editor)
+
+    def _flush_pending_updates(self):
+        """Apply all queued editor values, then notify the process node once"""
+        pending = self._pending_updates
+        self._pending_updates = {}
+        updated = False
+        for property_name, value in pending.items():
+            updated = self._apply_property(property_name, value) or updated
+        if updated and hasattr(self.process_node, 'data_changed'):
+            self.process_node.data_changed.emit()
+        self.refresh()
 
     def update_property(self, property_name, value):
         """Update a property value"""
+        if self._apply_property(property_name, value):
+            # Try to notify the process node of the change
+            if hasattr(self.process_node, 'data_changed'):
+                self.process_node.data_changed.emit()
+        
+        self.refresh()
+
+    def _apply_property(self, property_name, value):
+        """Write a property value to the process node; returns True if it was stored"""
         # Try different methods to update the property
         updated = False
         
@@ -397,43 +762,72 @@ class NodeWidget(QGraphicsRectItem):
             except:
                 pass
         
-        if updated:
-            # Try to notify the process node of the change
-            if hasattr(self.process_node, 'data_changed'):
-                self.process_node.data_changed.emit()
-        
-        self.refresh()
+        return updated
 
     def adjust_card_size_for_properties(self):
+        """Schedule a card resize; bursts of calls within one event-loop pass resize only once"""
+        if self._resize_pending:
+            return
+        self._resize_pending = True
+        QTimer.singleShot(0, self._do_adjust_card_size)
+
+    def _do_adjust_card_size(self):
         """Adjust card size to fit properties"""
-        num_props = 0
-        
-        # Count properties from various sources
-        if hasattr(self.process_node, 'input_ports'):
-            num_props = len(self.process_node.input_ports)
-        elif hasattr(self.process_node, 'inputs'):
-            num_props = len(self.process_node.inputs)
-        elif hasattr(self.process_node, 'properties'):
-            num_props = len(self.process_node.properties)
+        self._resize_pending = False
+        # Size for the rows actually laid out for painting/editing
+        num_props = len(self._prop_names)
         
         min_height = 100
         prop_height = 22 * num_props + self.header_height + 25
         new_height = max(min_height, prop_height)
         
         # Update node dimensions
+        if new_height == self.node_height:
+            return
+        try:
+            self.prepareGeometryChange()
+        except RuntimeError:
+            return  # the card was deleted before the deferred resize ran
         self.node_height = new_height
+        self._rebuild_geometry_cache()
         self.setRect(0, 0, self.node_width, self.node_height)
 
     def refresh(self):
+        """Schedule a display refresh; repeated calls in one event-loop pass refresh once"""
+        if self._refresh_scheduled:
+            return
+        self._refresh_scheduled = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
         """Refresh the widget display"""
+        self._refresh_scheduled = False
+        try:
+            self.scene()
+        except RuntimeError:
+            return  # the card was deleted before the deferred refresh ran
         if self.editing:
             self.start_editing()
-        else:
-            self.show_properties_on_card()
+            return
+        # show_properties_on_card() itself skips the rebuild when nothing shown has changed
+        self.show_properties_on_card()
 
     def update_node(self):
         """Update node display when data changes"""
-        self.refresh()
+        if self._update_title():
+            self.update()  # renamed
+        if _refresh_paused:
+            _deferred_refresh.add(self)
+            return
+        # Queue on the scene so a change rippling through the graph refreshes each card once
+        scene = self.scene()
+        if scene is None or not hasattr(scene, '_pending_refresh'):
+            self.refresh()
+            return
+        scene._pending_refresh.add(self)
+        if not scene._refresh_scheduled:
+            scene._refresh_scheduled = True
+            QTimer.singleShot(0, scene._flush_refreshes)
 
     def hoverEnterEvent(self, event):
         """Handle hover enter"""
@@ -447,11 +841,15 @@ class NodeWidget(QGraphicsRectItem):
 
     def focusOutEvent(self, event):
         """Handle focus out"""
-        self.finish_editing()
+        # Focus passing to one of our own editors isn't the user leaving the card
+        if not self._focus_moved_within_card():
+            self.finish_editing()
         super().focusOutEvent(event)
 
     def keyPressEvent(self, event):
         """Handle key press events"""
+        if not self.editing:
+            return super().keyPressEvent(event)  # Escape only means something while editing
         if event.key() == Qt.Key_Escape:
             self.finish_editing()
             return
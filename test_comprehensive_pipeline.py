@@ -3,10 +3,6 @@
 Comprehensive test of MockNode data creation pipeline functionality
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.nodes import MockNode, PrintNode, AggregateNode, FilterNode
 from src.core import Pipeline, DataNode
 
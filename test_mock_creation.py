@@ -2,10 +2,6 @@
 """
 Test script to verify that mock data nodes can be created and executed
 """
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from src.nodes import create_node, NODE_TYPES
 
 def test_mock_node_creation():
@@ -43,9 +39,9 @@ def test_mock_node_creation():
                 # Get the output
                 if success and "mock_data" in node.output_ports:
                     output = node.get_output_value("mock_data")
-                    if output:
+                    if output is not None and len(output):
                         print(f"  ✓ Generated {len(output)} items")
-                        print(f"  ✓ Sample: {output[0] if output else 'None'}")
+                        print(f"  ✓ Sample: {output[0]}")
                     
         except Exception as e:
             print(f"  ✗ Error: {e}")
@@ -5,71 +5,111 @@ Test script for MockNode functionality
 
 import sys
 import os
+import json
+from importlib.metadata import version
+import numpy as np
+import pytest
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from src.nodes import MockNode
 
-from nodes import MockNode
+# Expected output of the seeded test cases; rebuild with: python test_mock_node.py --regen
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_mock_node_fixtures.json')
+
+# Test different data types
+TEST_CASES = [
+    {"data_type": "text", "size": 5, "min_length": 10, "max_length": 50},
+    {"data_type": "first_name", "size": 3},
+    {"data_type": "email", "size": 4},
+    {"data_type": "integer", "size": 5, "min_length": 1, "max_length": 100},
+    {"data_type": "float", "size": 3, "min_length": 0, "max_length": 10},
+    {"data_type": "phone", "size": 2},
+    {"data_type": "address", "size": 2},
+    {"data_type": "url", "size": 3},
+    {"data_type": "boolean", "size": 5},
+    {"data_type": "uuid", "size": 2},
+]
+
+# Drawn only from NumPy/xorshift, so stable across installs; every other case comes from
+# Mimesis' locale data and RNG use, which change between Mimesis versions
+NUMPY_BACKED = {"age", "integer", "float", "boolean", "uuid"}
+
+def _run_case(test_case):
+    """Create and process one MockNode; returns (success, mock_data)"""
+    node = MockNode(**test_case)
+    success = node.process()
+    return success, node.get_output_value("mock_data") if success else None
+
+def _seeded_outputs():
+    """Generate every test case with a fixed seed (its index), as JSON-ready lists keyed by case id"""
+    outputs = {}
+    for i, test_case in enumerate(TEST_CASES):
+        success, mock_data = _run_case({**test_case, "seed": i})
+        data = mock_data.tolist() if isinstance(mock_data, np.ndarray) else list(mock_data or [])
+        outputs[f"{i}:{test_case['data_type']}"] = data if success else None
+    return outputs
+
+def regen_fixtures():
+    fixture = {"mimesis_version": version("mimesis"), "cases": _seeded_outputs()}
+    with open(FIXTURES_PATH, 'w', encoding='utf-8') as f:
+        json.dump(fixture, f, indent=2)
+    print(f"Wrote {FIXTURES_PATH}")
 
 def test_mock_node():
     print("Testing MockNode functionality...")
-    
-    # Test different data types
-    test_cases = [
-        {"data_type": "text", "size": 5, "min_length": 10, "max_length": 50},
-        {"data_type": "first_name", "size": 3},
-        {"data_type": "email", "size": 4},
-        {"data_type": "integer", "size": 5, "min_length": 1, "max_length": 100},
-        {"data_type": "float", "size": 3, "min_length": 0, "max_length": 10},
-        {"data_type": "phone", "size": 2},
-        {"data_type": "address", "size": 2},
-        {"data_type": "url", "size": 3},
-        {"data_type": "boolean", "size": 5},
-        {"data_type": "uuid", "size": 2},
-    ]
+    test_cases = TEST_CASES
     
     for i, test_case in enumerate(test_cases, 1):
         print(f"\n--- Test Case {i}: {test_case['data_type']} ---")
+        success, mock_data = _run_case(test_case)
+        assert success, f"Node processing failed for {test_case['data_type']}"
         
-        # Create MockNode with test parameters
-        node = MockNode(**test_case)
+        print(f"✓ Generated {len(mock_data)} items of type '{test_case['data_type']}'")
+        print(f"Sample data: {mock_data[:3]}")  # Show first 3 items
         
-        # Process the node
-        success = node.process()
+        # Validate size
+        expected_size = test_case.get('size', 10)
+        assert len(mock_data) == expected_size, f"Size validation failed: expected {expected_size}, got {len(mock_data)}"
+        print(f"✓ Size validation passed: {len(mock_data)} items")
         
-        if success:
-            # Get the generated data
-            mock_data = node.get_output_value("mock_data")
-            print(f"✓ Generated {len(mock_data)} items of type '{test_case['data_type']}'")
-            print(f"Sample data: {mock_data[:3]}")  # Show first 3 items
-            
-            # Validate size
-            expected_size = test_case.get('size', 10)
-            if len(mock_data) == expected_size:
-                print(f"✓ Size validation passed: {len(mock_data)} items")
-            else:
-                print(f"✗ Size validation failed: expected {expected_size}, got {len(mock_data)}")
-                
-            # Validate length constraints for text data
-            if test_case['data_type'] in ['text', 'word'] and 'min_length' in test_case:
-                min_len = test_case['min_length']
-                max_len = test_case.get('max_length')
-                for item in mock_data:
-                    if isinstance(item, str):
-                        if len(item) < min_len:
-                            print(f"✗ Length validation failed: '{item}' is shorter than {min_len}")
-                        elif max_len and len(item) > max_len:
-                            print(f"✗ Length validation failed: '{item}' is longer than {max_len}")
-                print(f"✓ Length constraints validated")
-                        
-        else:
-            print(f"✗ Node processing failed for {test_case['data_type']}")
+        # Validate length constraints for text data
+        if test_case['data_type'] in ['text', 'word'] and 'min_length' in test_case:
+            min_len = test_case['min_length']
+            max_len = test_case.get('max_length')
+            # One vectorized bounds check; only walk the items to report offenders
+            texts = [item for item in mock_data if isinstance(item, str)]
+            lens = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+            bad = lens < min_len
+            if max_len:
+                bad |= lens > max_len
+            offenders = [texts[j] for j in np.flatnonzero(bad)]
+            assert not offenders, f"Length validation failed (expected {min_len}..{max_len}): {offenders}"
+            print(f"✓ Length constraints validated")
+
+def test_seeded_fixtures():
+    print("\n\n=== Testing Seeded Output Against Fixtures ===")
+    if not os.path.exists(FIXTURES_PATH):
+        pytest.skip(f"No fixtures at {FIXTURES_PATH} (create them with --regen)")
+    with open(FIXTURES_PATH, encoding='utf-8') as f:
+        fixture = json.load(f)
+    expected = fixture["cases"]
+    same_mimesis = fixture.get("mimesis_version") == version("mimesis")
+    skipped = []
+    for case_id, data in _seeded_outputs().items():
+        assert case_id in expected, f"{case_id} missing from fixture; regenerate with --regen"
+        if case_id.split(":", 1)[1] not in NUMPY_BACKED and not same_mimesis:
+            skipped.append(case_id)
+            continue
+        assert data == expected[case_id], f"{case_id} differs from fixture: {data} != {expected[case_id]}"
+        print(f"✓ {case_id} matches fixture")
+    if skipped:
+        pytest.skip(f"Fixture was generated with mimesis {fixture.get('mimesis_version')}, "
+                    f"installed {version('mimesis')}: not comparing {', '.join(skipped)}")
 
 def test_node_chaining():
     print("\n\n=== Testing Node Chaining ===")
     
     # Import additional nodes for chaining test
-    from nodes import PrintNode
+    from src.nodes import PrintNode
     
     # Create MockNode for integers
     mock_node = MockNode("integer", size=10, min_length=1, max_length=50)
@@ -98,8 +138,15 @@ def test_node_chaining():
         print("✗ Mock node processing failed!")
 
 if __name__ == "__main__":
+    if "--regen" in sys.argv[1:]:
+        regen_fixtures()
+        sys.exit(0)
     try:
         test_mock_node()
+        try:
+            test_seeded_fixtures()
+        except pytest.skip.Exception as skip:
+            print(f"Skipped: {skip}")
         test_node_chaining()
         print("\n🎉 All tests completed!")
     except Exception as e:
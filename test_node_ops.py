@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for the data helpers behind the processing nodes
+"""
+
+from src.nodes import AggregateNode, LazyListSlice
+
+
+def test_lazy_list_slice_steps():
+    """Stepped and reversed views must match slicing a list"""
+    data = tuple(range(10))
+    view = LazyListSlice(data, 0, len(data))
+    expected = list(data)
+    for index in (slice(None, None, 2), slice(1, 9, 3), slice(None, None, -1), slice(8, 1, -2), slice(5, 2)):
+        sliced = view[index]
+        assert list(sliced) == expected[index], index
+        assert len(sliced) == len(expected[index]), index
+        assert sliced == expected[index], index
+    # Slicing a view of a view
+    assert list(LazyListSlice(data, 2, 8)[::-3]) == [7, 4]
+    print("✓ LazyListSlice stepped and reversed slices")
+
+
+def test_aggregate_sum_int64_boundary():
+    """Integer sums past the int64 range must stay exact instead of wrapping"""
+    node = AggregateNode("sum")
+    assert node.aggregate([2**62, 2**62]) == 2**63
+    assert node.aggregate([-2**62, -2**62, -1]) == -2**63 - 1
+    assert node.aggregate([2**63 - 1, 0]) == 2**63 - 1
+    assert node.aggregate([1, 2, 3]) == 6
+    print("✓ AggregateNode sum is exact across the int64 boundary")
+
+
+if __name__ == "__main__":
+    test_lazy_list_slice_steps()
+    test_aggregate_sum_int64_boundary()
+    print("\n🎉 All node op tests completed!")
@@ -2,17 +2,18 @@
 """
 Test script to verify that mock data nodes are available in the node palette
 """
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from PySide6.QtWidgets import QApplication
-from src.gui import NodePalette
-from src.nodes import NODE_TYPES
+import pytest
 
 def test_node_palette():
     """Test the node palette functionality"""
-    app = QApplication([])
+    # Qt is only loaded when this test actually runs, not when the file is imported/collected
+    pytest.importorskip("PySide6")
+    from PySide6.QtWidgets import QApplication, QTreeWidgetItemIterator
+    from src.gui import NodePalette
+    from src.nodes import NODE_TYPES_BY_PREFIX
+    
+    # Reuse the running application when called repeatedly in one process
+    app = QApplication.instance() or QApplication([])
     
     # Create node palette
     palette = NodePalette()
@@ -21,23 +22,24 @@ def test_node_palette():
     print("=" * 50)
     
     # Check if mock data nodes are in NODE_TYPES
-    mock_nodes = [k for k in NODE_TYPES.keys() if k.startswith('mock')]
+    mock_nodes = NODE_TYPES_BY_PREFIX.get('mock', [])
     print(f"Found {len(mock_nodes)} mock data node types in NODE_TYPES:")
     for node in sorted(mock_nodes):
         print(f"  - {node}")
     
     print("\nNode Palette Categories:")
-    root = palette.node_tree.invisibleRootItem()
-    for i in range(root.childCount()):
-        category_item = root.child(i)
-        category_name = category_item.text(0)
-        print(f"\n{category_name}:")
-        
-        for j in range(category_item.childCount()):
-            node_item = category_item.child(j)
-            node_name = node_item.text(0)
-            node_type = node_item.data(0, 2)  # Qt.UserRole = 2
-            print(f"  - {node_name} (type: {node_type})")
+    # Read the tree in one flat walk, then print from plain Python data
+    items = []
+    it = QTreeWidgetItemIterator(palette.node_tree)
+    while it.value():
+        item = it.value()
+        items.append((item.parent() is None, item.text(0), item.data(0, 2)))  # Qt.UserRole = 2
+        it += 1
+    for is_category, text, node_type in items:
+        if is_category:
+            print(f"\n{text}:")
+        else:
+            print(f"  - {text} (type: {node_type})")
     
     print("\n" + "=" * 50)
     print("Test completed successfully!")
@@ -3,10 +3,6 @@
 Simple test to debug pipeline data flow
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.nodes import MockNode, PrintNode
 from src.core import Pipeline
 